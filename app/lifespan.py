@@ -1,32 +1,77 @@
 """
 Application lifecycle management.
+
+Single home of the MCP server lifespan: constructs the shared service
+singletons, wires them into the lifespan context and manages the
+background log-flush task.
 """
 
-from contextlib import asynccontextmanager
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager, suppress
+from typing import Any
 
-import structlog
-from fastapi import FastAPI
+import httpx
+from mcp.server.fastmcp import FastMCP
 
+from app.logging import configure_logging, flush_logs, get_logger
+from services.message_service_batch import BatchingMessageService
 from services.message_service_mock import MockMessageService
+from services.whatsapp_service_mock import MockWhatsAppService
+
+# Set up structured logging through the configured pipeline
+logger = get_logger(__name__)
+
+# Singleton service instances created once per process. Every lifespan
+# invocation injects the same objects so per-service caches and connection
+# pools are reused across requests instead of being rebuilt.
+_message_service = BatchingMessageService(
+    MockMessageService()  # Using mock service for tests
+)
+_whatsapp_service = MockWhatsAppService()
 
-# Set up structured logging
-logger = structlog.get_logger(__name__)
+
+async def _flush_logs_periodically(interval: float = 0.2) -> None:
+    """Flush buffered log output on a timer to bound log latency."""
+    while True:
+        await asyncio.sleep(interval)
+        flush_logs()
 
 
 @asynccontextmanager
-async def lifespan(app: FastAPI):
+async def lifespan(_: FastMCP) -> AsyncIterator[dict[str, Any]]:
     """Set up and tear down application resources."""
+    configure_logging()
+    logger.info(
+        "Services initialized",
+        message_service_id=id(_message_service),
+        whatsapp_service_id=id(_whatsapp_service),
+    )
 
-    # Initialize mock services
-    message_service = MockMessageService()
-
-    # Store in app state and lifespan context
-    app.state.lifespan_context = {
-        "message_service": message_service,
-    }
+    flush_task = asyncio.create_task(_flush_logs_periodically())
 
-    logger.info("Mock services initialized", event="startup")
+    # One pooled HTTP client for the whole process: keep-alive connections
+    # mean outbound calls skip the TCP+TLS handshake after the first request
+    http_client = httpx.AsyncClient(
+        limits=httpx.Limits(max_connections=100, max_keepalive_connections=50)
+    )
 
-    yield
+    _message_service.start()
 
-    logger.info("Application shutting down", event="shutdown")
+    try:
+        # Yield shared context
+        lifespan_context = {
+            "message_service": _message_service,
+            "whatsapp_service": _whatsapp_service,
+            "http_client": http_client,
+        }
+        yield lifespan_context
+    finally:
+        # Cleanup resources
+        await _message_service.stop()
+        await http_client.aclose()
+        flush_task.cancel()
+        with suppress(asyncio.CancelledError):
+            await flush_task
+        flush_logs()
+        logger.info("Application shutting down")
@@ -6,15 +6,41 @@ This module provides a structured logging setup using structlog:
 - Production: JSON format for better integration with log aggregation systems
 """
 
+import atexit
+import io
 import os
+import sys
 from typing import Any
 
 import structlog
 from rich.console import Console
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - optional speedup, stdlib json still works
+    orjson = None
+
 # Rich console for development logging
 console = Console()
 
+# Cache of already-built loggers keyed by name; mirrors structlog's
+# cache_logger_on_first_use but saves the proxy construction per call
+_logger_cache: dict[str, Any] = {}
+
+# Buffered writer used for production log output; coalesces many small JSON
+# lines into a single write() syscall
+_log_buffer: io.BufferedWriter | None = None
+
+
+def flush_logs() -> None:
+    """Flush the buffered production log writer, if one is active."""
+    if _log_buffer is not None:
+        _log_buffer.flush()
+
+
+# Whether configure_logging has already run; makes repeat no-arg calls cheap
+_configured = False
+
 
 def configure_logging(env: str | None = None) -> None:
     """
@@ -24,44 +50,76 @@ def configure_logging(env: str | None = None) -> None:
         env: The environment to configure for ("development" or "production").
              If None, will try to read from ENVIRONMENT env var, defaulting to "development".
     """
-    # Determine environment
+    global _configured
+
+    # Determine environment. No-arg calls are idempotent so lifespan and the
+    # CLI entry point can both call this without repeating the setup work;
+    # an explicit env always reconfigures.
     if env is None:
+        if _configured:
+            return
         env = os.environ.get("ENVIRONMENT", "development")
+    _configured = True
 
-    # Common processors for all environments
+    # Minimal hot-path processors shared by all environments. Every processor
+    # here runs on every log call, so keep this list short.
     shared_processors: list[Any] = [
         structlog.contextvars.merge_contextvars,
         structlog.stdlib.add_log_level,
-        structlog.stdlib.add_logger_name,
-        structlog.processors.TimeStamper(fmt="iso"),
-        structlog.processors.StackInfoRenderer(),
     ]
 
     # Configure based on environment
+    logger_factory: Any = structlog.stdlib.LoggerFactory()
     if env.lower() == "development":
-        # Development: Rich console output
+        # Development: Rich console output with the more expensive
+        # logger-name/stack processors that aid debugging
         processors = [
             *shared_processors,
+            structlog.processors.TimeStamper(fmt="iso", utc=True),
+            structlog.stdlib.add_logger_name,
+            structlog.processors.StackInfoRenderer(),
             # Add color and proper formatting
             structlog.dev.ConsoleRenderer(
                 colors=True, exception_formatter=structlog.dev.rich_traceback
             )
         ]
     else:
-        # Production: JSON format
+        # Production: JSON format. format_exc_info/dict_tracebacks are cheap
+        # no-ops unless the event carries exc_info, so they can stay.
         processors = [
             *shared_processors,
+            # Epoch-float timestamps: one time.time() call per record, no
+            # strftime, and floats serialize faster than ISO strings
+            structlog.processors.TimeStamper(fmt=None, utc=True),
             # Convert exceptions to dict before JSON serializing
             structlog.processors.format_exc_info,
             structlog.processors.dict_tracebacks,
-            # Render as JSON
-            structlog.processors.JSONRenderer(),
         ]
+        if orjson is not None:
+            # orjson serializes straight to bytes (~2x stdlib json), so pair it
+            # with a bytes logger writing to a buffered stdout to skip the
+            # bytes -> str -> bytes round-trip and amortize write() syscalls
+            # across many records. flush_logs() bounds log latency.
+            global _log_buffer
+            if _log_buffer is None:
+                _log_buffer = io.BufferedWriter(
+                    sys.stdout.buffer, buffer_size=65536
+                )
+                atexit.register(flush_logs)
+            processors.append(
+                structlog.processors.JSONRenderer(serializer=orjson.dumps)
+            )
+            logger_factory = structlog.BytesLoggerFactory(file=_log_buffer)
+        else:
+            processors.append(structlog.processors.JSONRenderer())
+
+    # Drop loggers built under the previous configuration
+    _logger_cache.clear()
 
     # Apply configuration
     structlog.configure(
         processors=processors,
-        logger_factory=structlog.stdlib.LoggerFactory(),
+        logger_factory=logger_factory,
         wrapper_class=structlog.stdlib.BoundLogger,
         cache_logger_on_first_use=True,
     )
@@ -78,17 +136,12 @@ def get_logger(name: str | None = None) -> structlog.stdlib.BoundLogger:
         A configured structlog logger
     """
     if name is None:
-        # Use the calling module name if no name provided
-        # Using inspect instead of sys._getframe to avoid private method usage
-        import inspect
-        frame = inspect.currentframe()
-        if frame and frame.f_back:
-            name = frame.f_back.f_globals.get("__name__", "unknown")
-        else:
-            name = "unknown"
-
-    return structlog.get_logger(name)
-
-
-# Configure logging when this module is imported
-configure_logging()
+        # Use the calling module name if no name provided.
+        # sys._getframe is a single C call, much cheaper than inspect's
+        # FrameInfo machinery on this per-log-site path.
+        name = sys._getframe(1).f_globals.get("__name__", "unknown")
+
+    cached = _logger_cache.get(name)
+    if cached is None:
+        cached = _logger_cache.setdefault(name, structlog.get_logger(name))
+    return cached
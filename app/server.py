@@ -4,53 +4,96 @@ Tools System MCP Server
 Provides messaging and notification tools using the Model Context Protocol
 """
 
-from collections.abc import AsyncIterator
-from contextlib import asynccontextmanager
-from pathlib import Path
+import asyncio
+import functools
+import sys
+import time
 from typing import Any
 
-import dotenv
 from mcp.server.fastmcp import Context, FastMCP
 
-from services.message_service_mock import MockMessageService
-from services.whatsapp_service_mock import MockWhatsAppService
-from tools.alert_tool import AlertTool
-from tools.button_tool import ButtonTool
-from tools.document_tool import DocumentTool
-from tools.image_tool import ImageTool
-from tools.sleep_tool import SleepTool
-from tools.text_tool import TextTool
-from tools.video_tool import VideoTool
-
-# Load environment variables from .env file
-dotenv_path = Path(__file__).parent.parent / ".env"
-if dotenv_path.exists():
-    dotenv.load_dotenv(str(dotenv_path))
+from app.lifespan import lifespan
+from app.logging import configure_logging, get_logger
+
+# Tool classes are imported lazily inside each handler to keep server
+# cold-start imports down; sys.modules makes repeat imports a dict hit.
+
+logger = get_logger(__name__)
+
 
 # Create the MCP server
-mcp = FastMCP(title="YaVendió Tools")
+mcp = FastMCP(title="YaVendió Tools", lifespan=lifespan)
 
 
-@asynccontextmanager
-async def lifespan(_: FastMCP) -> AsyncIterator[dict[str, Any]]:
-    """Application lifecycle management with typed context."""
-    # Setup resources
-    message_service = MockMessageService()  # Using mock service for tests
-    whatsapp_service = MockWhatsAppService()  # Add WhatsApp service
+# Pre-built success payload; handlers merge it via unpacking so the
+# "status"/"success" pair is hashed and interned once at import time
+_SUCCESS: dict[str, Any] = {"status": "success"}
 
-    try:
-        # Yield shared context
-        lifespan_context = {
-            "message_service": message_service,
-            "whatsapp_service": whatsapp_service,  # Add WhatsApp service to context
-        }
-        yield lifespan_context
-    finally:
-        # Cleanup resources
-        pass
+
+def _wrap_errors(tool_name: str, error_message: str):
+    """Wrap a tool handler with the standard error envelope.
+
+    Replaces the per-handler try/except boilerplate: exceptions are logged
+    with the tool name and surface as the usual ``{"status": "error"}``
+    payload with a stable message. functools.wraps preserves the original
+    signature so FastMCP's schema introspection is unaffected.
+
+    Args:
+        tool_name: Name logged on failure
+        error_message: Stable client-facing message on failure
+    """
+
+    def decorator(fn: Any) -> Any:
+        @functools.wraps(fn)
+        async def wrapper(*args: Any, **kwargs: Any) -> dict[str, Any]:
+            try:
+                return await fn(*args, **kwargs)
+            except Exception:
+                logger.exception("tool_failed", tool=tool_name)
+                return {"status": "error", "message": error_message}
+
+        return wrapper
+
+    return decorator
+
+
+def _build_context(
+    lifespan_ctx: dict[str, Any], company_id: str, phone_number: str
+) -> dict[str, Any]:
+    """Build the execution context shared by every tool handler."""
+    return {
+        "company_id": company_id,
+        "phone_number": phone_number,
+        "lifespan_context": lifespan_ctx,
+    }
+
+
+def _normalize_urls(urls: list[str] | str) -> list[str]:
+    """Normalize a single URL or list of URLs to a canonical list."""
+    # type() identity check is the common single-URL case and skips the
+    # isinstance MRO walk
+    if type(urls) is str:
+        return [urls]
+    return list(urls)
+
+
+def _normalize_files(
+    files: list[dict[str, str]] | dict[str, str] | str,
+    default_filename: str = "document.pdf",
+) -> list[dict[str, str]]:
+    """Normalize document input to a canonical list of file dicts."""
+    # The union members are concrete, so dispatch on type() identity first
+    # and keep isinstance only as a subclass fallback
+    t = type(files)
+    if t is str:
+        return [{"url": files, "filename": default_filename}]
+    if t is dict or isinstance(files, dict):
+        return [files]
+    return list(files)
 
 
 @mcp.tool()
+@_wrap_errors("send_text", "Failed to send message")
 async def send_text(
     ctx: Context,
     company_id: str,
@@ -66,34 +109,121 @@ async def send_text(
         message: Text to send
         client_id: Optional WhatsApp client ID (if None, uses default client for company)
     """
+    lifespan_ctx = ctx.request_context.lifespan_context
     # If client_id is provided, use WhatsApp service directly
     if client_id:
-        whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
-        try:
-            message_id = await whatsapp_service.send_text(
-                client_id=client_id, to=phone_number, text=message
-            )
-            return {"status": "success", "message_id": message_id}
-        except Exception as e:
-            return {"status": "error", "message": f"Failed to send message: {e!s}"}
+        whatsapp_service = lifespan_ctx["whatsapp_service"]
+        message_id = await whatsapp_service.send_text(
+            client_id=client_id, to=phone_number, text=message
+        )
+        return {**_SUCCESS, "message_id": message_id}
 
     # Otherwise use the TextTool for general routing
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    context = _build_context(lifespan_ctx, company_id, phone_number)
+
+    from tools.text_tool import TextTool
 
     tool = TextTool(message)
     message_id = await tool.execute(context)
 
-    return {
-        "status": "success",
-        "message_id": message_id,
-    }
+    return {**_SUCCESS, "message_id": message_id}
+
+
+async def _send_media(
+    ctx: Context,
+    company_id: str,
+    phone_number: str,
+    urls: list[str] | str,
+    client_id: str | None,
+    caption: str | None,
+    media_kind: str,
+    tool_cls: type,
+) -> dict[str, Any]:
+    """Shared implementation for the send_image/send_video handlers.
+
+    Args:
+        media_kind: "image" or "video"; selects the WhatsApp service method
+                    and its media keyword argument
+        tool_cls: Tool class used for the general routing path
+    """
+    lifespan_ctx = ctx.request_context.lifespan_context
+    # Normalize once at entry so both branches work on a canonical list
+    url_list = _normalize_urls(urls)
+
+    # If client_id is provided, use WhatsApp service directly
+    if client_id:
+        whatsapp_service = lifespan_ctx["whatsapp_service"]
+        # For WhatsApp service, we can only send one item at a time
+        send = getattr(whatsapp_service, f"send_{media_kind}")
+        message_id = await send(
+            client_id=client_id,
+            to=phone_number,
+            caption=caption or "",
+            **{media_kind: url_list[0]},
+        )
+        return {**_SUCCESS, "message_id": message_id}
+
+    # Otherwise use the media tool for general routing
+    context = _build_context(lifespan_ctx, company_id, phone_number)
+
+    tool = tool_cls(url_list)
+    message_ids = await tool.execute(context)
+
+    return {**_SUCCESS, "message_ids": message_ids}
 
 
 @mcp.tool()
+@_wrap_errors("send_text_batch", "Failed to send batch")
+async def send_text_batch(
+    ctx: Context,
+    company_id: str,
+    messages: list[dict[str, str]],
+    client_id: str | None = None,
+) -> dict[str, Any]:
+    """Send multiple text messages concurrently.
+
+    Args:
+        company_id: Company identifier
+        messages: List of {"phone_number": "...", "message": "..."} entries
+        client_id: Optional WhatsApp client ID (if None, uses default client for company)
+    """
+    lifespan_ctx = ctx.request_context.lifespan_context
+
+    # Fan the sends out concurrently; a batch completes in roughly one
+    # round-trip instead of N sequential ones
+    if client_id:
+        whatsapp_service = lifespan_ctx["whatsapp_service"]
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    whatsapp_service.send_text(
+                        client_id=client_id,
+                        to=entry["phone_number"],
+                        text=entry["message"],
+                    )
+                )
+                for entry in messages
+            ]
+    else:
+        from tools.text_tool import TextTool
+
+        async with asyncio.TaskGroup() as tg:
+            tasks = [
+                tg.create_task(
+                    TextTool(entry["message"]).execute(
+                        _build_context(
+                            lifespan_ctx, company_id, entry["phone_number"]
+                        )
+                    )
+                )
+                for entry in messages
+            ]
+
+    return {**_SUCCESS, "message_ids": [task.result() for task in tasks]}
+
+
+@mcp.tool()
+@_wrap_errors("send_image", "Failed to send image")
 async def send_image(
     ctx: Context,
     company_id: str,
@@ -111,39 +241,16 @@ async def send_image(
         client_id: Optional WhatsApp client ID (if None, uses default client for company)
         caption: Optional caption for the image (only used with client_id)
     """
-    # If client_id is provided, use WhatsApp service directly
-    if client_id:
-        whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
-        try:
-            # For WhatsApp service, we can only send one image at a time
-            image_url = image_urls[0] if isinstance(image_urls, list) else image_urls
-            message_id = await whatsapp_service.send_image(
-                client_id=client_id,
-                to=phone_number,
-                image=image_url,
-                caption=caption or "",
-            )
-            return {"status": "success", "message_id": message_id}
-        except Exception as e:
-            return {"status": "error", "message": f"Failed to send image: {e!s}"}
-
-    # Otherwise use the ImageTool for general routing
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
-
-    tool = ImageTool(image_urls)
-    message_ids = await tool.execute(context)
+    from tools.image_tool import ImageTool
 
-    return {
-        "status": "success",
-        "message_ids": message_ids,
-    }
+    return await _send_media(
+        ctx, company_id, phone_number, image_urls, client_id, caption,
+        "image", ImageTool,
+    )
 
 
 @mcp.tool()
+@_wrap_errors("send_video", "Failed to send video")
 async def send_video(
     ctx: Context,
     company_id: str,
@@ -161,39 +268,16 @@ async def send_video(
         client_id: Optional WhatsApp client ID (if None, uses default client for company)
         caption: Optional caption for the video (only used with client_id)
     """
-    # If client_id is provided, use WhatsApp service directly
-    if client_id:
-        whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
-        try:
-            # For WhatsApp service, we can only send one video at a time
-            video_url = video_urls[0] if isinstance(video_urls, list) else video_urls
-            message_id = await whatsapp_service.send_video(
-                client_id=client_id,
-                to=phone_number,
-                video=video_url,
-                caption=caption or "",
-            )
-            return {"status": "success", "message_id": message_id}
-        except Exception as e:
-            return {"status": "error", "message": f"Failed to send video: {e!s}"}
-
-    # Otherwise use the VideoTool for general routing
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    from tools.video_tool import VideoTool
 
-    tool = VideoTool(video_urls)
-    message_ids = await tool.execute(context)
-
-    return {
-        "status": "success",
-        "message_ids": message_ids,
-    }
+    return await _send_media(
+        ctx, company_id, phone_number, video_urls, client_id, caption,
+        "video", VideoTool,
+    )
 
 
 @mcp.tool()
+@_wrap_errors("send_document", "Failed to send document")
 async def send_document(
     ctx: Context,
     company_id: str,
@@ -214,63 +298,42 @@ async def send_document(
         caption: Optional caption for the document (only used with client_id)
         filename: Optional filename for the document (only used with client_id and string URL)
     """
+    lifespan_ctx = ctx.request_context.lifespan_context
+    # Normalize once at entry so both branches work on a canonical list
+    files_list = _normalize_files(files, filename or "document.pdf")
+
     # If client_id is provided, use WhatsApp service directly
     if client_id:
-        whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
-        try:
-            # Extract document URL and filename based on input type
-            document_url: str = ""
-            doc_filename: str = "document.pdf"  # Default filename
-
-            if isinstance(files, str):
-                document_url = files
-                doc_filename = filename or doc_filename
-            elif isinstance(files, dict):
-                document_url = files.get("url", "")
-                doc_filename = files.get("filename") or filename or doc_filename
-            elif len(files) > 0:  # It's a list
-                document_url = files[0].get("url", "")
-                doc_filename = files[0].get("filename") or filename or doc_filename
-            else:
-                return {"status": "error", "message": "Invalid document files format"}
-
-            message_id = await whatsapp_service.send_document(
-                client_id=client_id,
-                to=phone_number,
-                document=document_url,
-                caption=caption or "",
-                filename=doc_filename,
-            )
-            return {"status": "success", "message_id": message_id}
-        except Exception as e:
-            return {"status": "error", "message": f"Failed to send document: {e!s}"}
+        whatsapp_service = lifespan_ctx["whatsapp_service"]
+        if not files_list:
+            return {"status": "error", "message": "Invalid document files format"}
+
+        first = files_list[0]
+        document_url = first.get("url", "")
+        doc_filename = first.get("filename") or filename or "document.pdf"
+
+        message_id = await whatsapp_service.send_document(
+            client_id=client_id,
+            to=phone_number,
+            document=document_url,
+            caption=caption or "",
+            filename=doc_filename,
+        )
+        return {**_SUCCESS, "message_id": message_id}
 
     # Otherwise use the DocumentTool for general routing
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    context = _build_context(lifespan_ctx, company_id, phone_number)
 
-    # Convert to proper format if needed
-    files_list: list[dict[str, str]] = []
-    if isinstance(files, str):
-        files_list = [{"url": files, "filename": filename or "document.pdf"}]
-    elif isinstance(files, dict):
-        files_list = [files]
-    else:
-        files_list = files
+    from tools.document_tool import DocumentTool
 
     tool = DocumentTool(files_list)
     message_ids = await tool.execute(context)
 
-    return {
-        "status": "success",
-        "message_ids": message_ids,
-    }
+    return {**_SUCCESS, "message_ids": message_ids}
 
 
 @mcp.tool()
+@_wrap_errors("send_alert", "Failed to send alert")
 async def send_alert(
     ctx: Context,
     company_id: str,
@@ -294,11 +357,10 @@ async def send_alert(
         pause_number: Whether to pause the conversation
         track_sale: Whether to track this as a sale
     """
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    lifespan_ctx = ctx.request_context.lifespan_context
+    context = _build_context(lifespan_ctx, company_id, phone_number)
+
+    from tools.alert_tool import AlertTool
 
     tool = AlertTool(
         message,
@@ -310,13 +372,11 @@ async def send_alert(
     )
     result = await tool.execute(context)
 
-    return {
-        "status": "success",
-        "result": result,
-    }
+    return {**_SUCCESS, "result": result}
 
 
 @mcp.tool()
+@_wrap_errors("sleep", "Failed to sleep")
 async def sleep(
     ctx: Context,
     company_id: str,
@@ -330,22 +390,19 @@ async def sleep(
         phone_number: Recipient's phone number
         seconds: Number of seconds to sleep
     """
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    lifespan_ctx = ctx.request_context.lifespan_context
+    context = _build_context(lifespan_ctx, company_id, phone_number)
+
+    from tools.sleep_tool import SleepTool
 
     tool = SleepTool(seconds)
     await tool.execute(context)
 
-    return {
-        "status": "success",
-        "seconds": seconds,
-    }
+    return {**_SUCCESS, "seconds": seconds}
 
 
 @mcp.tool()
+@_wrap_errors("send_button", "Failed to send buttons")
 async def send_button(
     ctx: Context,
     company_id: str,
@@ -371,36 +428,32 @@ async def send_button(
         payment_data: Payment data for payment buttons
         client_id: Optional WhatsApp client ID (if None, uses default client for company)
     """
+    lifespan_ctx = ctx.request_context.lifespan_context
     # If client_id is provided, use WhatsApp service directly
     if client_id:
-        whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
-        try:
-            # Convert buttons to WhatsApp format if needed
-            whatsapp_buttons = []
-            for button in buttons:
-                if "id" in button and "title" in button:
-                    whatsapp_buttons.append(
-                        {"title": button["title"], "callback_data": button["id"]}
-                    )
-                else:
-                    whatsapp_buttons.append(button)
-
-            message_id = await whatsapp_service.send_buttons(
-                client_id=client_id,
-                to=phone_number,
-                text=body_text,
-                buttons=whatsapp_buttons,
-            )
-            return {"status": "success", "message_id": message_id}
-        except Exception as e:
-            return {"status": "error", "message": f"Failed to send buttons: {e!s}"}
+        whatsapp_service = lifespan_ctx["whatsapp_service"]
+        # Convert buttons to WhatsApp format if needed
+        whatsapp_buttons = []
+        for button in buttons:
+            if "id" in button and "title" in button:
+                whatsapp_buttons.append(
+                    {"title": button["title"], "callback_data": button["id"]}
+                )
+            else:
+                whatsapp_buttons.append(button)
+
+        message_id = await whatsapp_service.send_buttons(
+            client_id=client_id,
+            to=phone_number,
+            text=body_text,
+            buttons=whatsapp_buttons,
+        )
+        return {**_SUCCESS, "message_id": message_id}
 
     # Otherwise use the ButtonTool for general routing
-    context: dict[str, Any] = {
-        "company_id": company_id,
-        "phone_number": phone_number,
-        "lifespan_context": ctx.request_context.lifespan_context,
-    }
+    context = _build_context(lifespan_ctx, company_id, phone_number)
+
+    from tools.button_tool import ButtonTool
 
     tool = ButtonTool(
         body_text,
@@ -412,33 +465,46 @@ async def send_button(
     )
     message_id = await tool.execute(context)
 
-    return {
-        "status": "success",
-        "message_id": message_id,
-    }
+    return {**_SUCCESS, "message_id": message_id}
+
+
+# Per-company config cache: config is read often and written rarely, so a
+# short TTL turns most get_config calls into a dict lookup. update_config
+# invalidates eagerly.
+_config_cache: dict[str, tuple[float, dict[str, Any]]] = {}
+_CONFIG_TTL_SECONDS = 60.0
 
 
 @mcp.tool()
-async def get_config(_ctx: Context, _company_id: str) -> dict[str, Any]:
+@_wrap_errors("get_config", "Failed to get config")
+async def get_config(_ctx: Context, company_id: str) -> dict[str, Any]:
     """Get company configuration.
 
     Args:
         company_id: Company identifier
     """
-    # Mock implementation that returns a sample config
+    now = time.monotonic()
+    cached = _config_cache.get(company_id)
+    if cached is not None and now - cached[0] < _CONFIG_TTL_SECONDS:
+        return {**_SUCCESS, "source": "cache", "config": cached[1]}
+
+    # Mock implementation that returns a sample config; in production this
+    # is where the backing store would be hit
     sample_config = {
         "welcome_message": "Hello, welcome to our service!",
         "auto_reply": True,
         "notification_emails": ["admin@example.com"],
         "company_name": "Test Company",
     }
+    _config_cache[company_id] = (now, sample_config)
 
-    return {"status": "success", "source": "mock", "config": sample_config}
+    return {**_SUCCESS, "source": "mock", "config": sample_config}
 
 
 @mcp.tool()
+@_wrap_errors("update_config", "Failed to update config")
 async def update_config(
-    _ctx: Context, _company_id: str, _config: dict[str, Any]
+    _ctx: Context, company_id: str, _config: dict[str, Any]
 ) -> dict[str, Any]:
     """Update company configuration.
 
@@ -446,14 +512,18 @@ async def update_config(
         company_id: Company identifier
         config: New configuration
     """
+    # Invalidate the cached entry so the next get_config re-reads
+    _config_cache.pop(company_id, None)
+
     # Mock implementation that pretends to update the config
-    return {"status": "success", "message": "Configuration updated (mock)"}
+    return {**_SUCCESS, "message": "Configuration updated (mock)"}
 
 
 # WhatsApp Client Management Tools
 
 
 @mcp.tool()
+@_wrap_errors("register_whatsapp_client", "Failed to register client")
 async def register_whatsapp_client(
     ctx: Context,
     client_id: str,
@@ -469,21 +539,19 @@ async def register_whatsapp_client(
     """
     whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
 
-    try:
-        # Client response is not needed, we just need the operation to succeed
-        _: Any = await whatsapp_service.register_client(
-            client_id=client_id, phone_id=phone_id, token=token
-        )
-        return {
-            "status": "success",
-            "client_id": client_id,
-            "message": "Client registered successfully",
-        }
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to register client: {e!s}"}
+    # Client response is not needed, we just need the operation to succeed
+    _: Any = await whatsapp_service.register_client(
+        client_id=client_id, phone_id=phone_id, token=token
+    )
+    return {
+        **_SUCCESS,
+        "client_id": client_id,
+        "message": "Client registered successfully",
+    }
 
 
 @mcp.tool()
+@_wrap_errors("list_whatsapp_clients", "Failed to list clients")
 async def list_whatsapp_clients(
     ctx: Context,
 ) -> dict[str, Any]:
@@ -494,11 +562,27 @@ async def list_whatsapp_clients(
     """
     whatsapp_service = ctx.request_context.lifespan_context["whatsapp_service"]
 
-    try:
-        clients = await whatsapp_service.list_clients()
-        return {"status": "success", "clients": clients}
-    except Exception as e:
-        return {"status": "error", "message": f"Failed to list clients: {e!s}"}
+    clients = await whatsapp_service.list_clients()
+    return {**_SUCCESS, "clients": clients}
+
+
+# Frozen name -> handler table built once at import time. The decorators
+# above already registered every tool (and their schemas) on the module
+# `mcp` instance, so repeat create_server calls never re-introspect.
+TOOL_FUNCTIONS: tuple[tuple[str, Any], ...] = (
+    ("send_text", send_text),
+    ("send_text_batch", send_text_batch),
+    ("send_image", send_image),
+    ("send_video", send_video),
+    ("send_document", send_document),
+    ("send_alert", send_alert),
+    ("sleep", sleep),
+    ("send_button", send_button),
+    ("get_config", get_config),
+    ("update_config", update_config),
+    ("register_whatsapp_client", register_whatsapp_client),
+    ("list_whatsapp_clients", list_whatsapp_clients),
+)
 
 
 async def create_server(mcp_instance: FastMCP | None = None) -> FastMCP:
@@ -510,40 +594,100 @@ async def create_server(mcp_instance: FastMCP | None = None) -> FastMCP:
     Returns:
         Configured FastMCP instance
     """
-    # Use provided instance or create a new one
-    server = mcp_instance or FastMCP(title="YaVendió Tools", lifespan=lifespan)
-
-    # For FastMCP, we need to use decorator syntax to register tools
-    # but we'll add the references to the tool_functions dict for documentation
-    tool_functions = {
-        "send_text": send_text,
-        "send_image": send_image,
-        "send_video": send_video,
-        "send_document": send_document,
-        "send_alert": send_alert,
-        "sleep": sleep,
-        "send_button": send_button,
-        "get_config": get_config,
-        "update_config": update_config,
-        "register_whatsapp_client": register_whatsapp_client,
-        "list_whatsapp_clients": list_whatsapp_clients,
+    # Common path: the module-level instance already has every tool
+    # registered at import time, so there is nothing left to do
+    if mcp_instance is None:
+        return mcp
+
+    # Testing support - try to register tools using a "register_tool" method if it exists
+    # This is only for test compatibility with mock servers
+    register_method = getattr(mcp_instance, "register_tool", None)
+    if register_method and callable(register_method):
+        for name, func in TOOL_FUNCTIONS:
+            register_method(name, func)
+
+    return mcp_instance
+
+
+def _load_env_cached(dotenv_path: Any) -> None:
+    """Load .env into os.environ, caching the parsed dict in a sidecar.
+
+    Re-parsing .env on every short-lived process adds up when many test
+    workers spawn; a pickled sidecar keyed on the file's mtime lets
+    unchanged files load with a single read. Like load_dotenv's default,
+    variables already exported in the shell win over .env entries.
+
+    Args:
+        dotenv_path: Path to the .env file
+    """
+    import os
+    import pickle
+
+    import dotenv
+
+    mtime = dotenv_path.stat().st_mtime
+    cache_path = dotenv_path.parent / ".env.cache.pkl"
+
+    if cache_path.exists():
+        try:
+            cached_mtime, values = pickle.loads(cache_path.read_bytes())
+            if cached_mtime == mtime:
+                for key, value in values.items():
+                    os.environ.setdefault(key, value)
+                return
+        except (pickle.PickleError, EOFError, ValueError):
+            pass  # Corrupt cache - fall through and re-parse
+
+    values = {
+        k: v for k, v in dotenv.dotenv_values(dotenv_path).items() if v is not None
     }
+    for key, value in values.items():
+        os.environ.setdefault(key, value)
+    try:
+        # 0600: the sidecar mirrors .env contents, so don't leave a
+        # world-readable copy next to it
+        fd = os.open(cache_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, "wb") as cache_file:
+            cache_file.write(pickle.dumps((mtime, values)))
+    except OSError:
+        pass  # Read-only filesystem - caching is best-effort
+
+
+def _bootstrap_runtime() -> None:
+    """Load .env and install uvloop for real server entry points.
+
+    Runs at import time because the documented entry points (``make run``,
+    ``mcp run``/``mcp dev``) import this module rather than executing it as
+    a script, so an ``if __name__ == "__main__"`` block never fires for
+    them. Skipped under pytest, where the stat + parse would tax every
+    test worker for variables the suite does not use.
+    """
+    from pathlib import Path
+
+    # Load environment variables from .env
+    dotenv_path = Path(__file__).parent.parent / ".env"
+    if dotenv_path.exists():
+        _load_env_cached(dotenv_path)
+
+    # Use uvloop's libuv-backed event loop where available; it cuts
+    # coroutine scheduling overhead substantially versus the default loop.
+    # Must run before any event loop exists, so it cannot wait for the
+    # lifespan.
+    if sys.platform != "win32":
+        try:
+            import uvloop
+
+            uvloop.install()
+        except ImportError:
+            pass
 
-    # When a mock server is provided (for testing), we need to register tools explicitly
-    if mcp_instance is not None:
-        # Testing support - try to register tools using a "register_tool" method if it exists
-        # This is only for test compatibility with mock servers
-        register_method = getattr(mcp_instance, "register_tool", None)
-        if register_method and callable(register_method):
-            for name, func in tool_functions.items():
-                register_method(name, func)
 
-    return server
+if "pytest" not in sys.modules:
+    _bootstrap_runtime()
 
 
 if __name__ == "__main__":
-    # Add logging to help debug
-    import sys
+    configure_logging()
 
     print("Starting YaVendió Tools MCP server...", file=sys.stderr)
 
@@ -6,10 +6,11 @@ Runs all tests with coverage reporting.
 
 import argparse
 import os
-import subprocess
 import sys
 from pathlib import Path
 
+import pytest
+
 
 def main():
     """Run tests with coverage reporting."""
@@ -39,13 +40,13 @@ def main():
     root_dir = Path(__file__).parents[1]
     os.chdir(root_dir)
 
-    # Build command
-    cmd = ["python", "-m"]
+    # Build pytest arguments; running in-process via pytest.main skips a
+    # full interpreter startup per test run
+    cmd = []
 
     if not args.no_coverage:
         cmd.extend(
             [
-                "pytest",
                 "--cov=app",
                 "--cov=services",
                 "--cov=tools",
@@ -58,8 +59,6 @@ def main():
 
         if args.xml:
             cmd.append("--cov-report=xml")
-    else:
-        cmd.append("pytest")
 
     if args.verbose:
         cmd.append("-v")
@@ -70,20 +69,16 @@ def main():
     if args.markers:
         cmd.extend(["-m", args.markers])
 
-    # Run the command
-    try:
-        print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, check=True)
+    # Run pytest in-process
+    print(f"Running: pytest {' '.join(cmd)}")
+    returncode = pytest.main(cmd)
 
-        if not args.no_coverage and args.html:
-            print(
-                f"\nHTML coverage report generated in {root_dir / 'htmlcov/index.html'}"
-            )
+    if returncode != 0:
+        print(f"Tests failed with exit code {returncode}")
+    elif not args.no_coverage and args.html:
+        print(f"\nHTML coverage report generated in {root_dir / 'htmlcov/index.html'}")
 
-        return result.returncode
-    except subprocess.CalledProcessError as e:
-        print(f"Tests failed with exit code {e.returncode}")
-        return e.returncode
+    return returncode
 
 
 if __name__ == "__main__":
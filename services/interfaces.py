@@ -23,6 +23,22 @@ class MessageServiceInterface(ABC):
         """
         pass
 
+    async def insert_messages(self, messages: list[dict[str, Any]]) -> list[str]:
+        """
+        Insert many messages in one call.
+
+        Default implementation inserts sequentially; implementations
+        backed by a real store should override with a single bulk write
+        so N messages cost one round trip instead of N.
+
+        Args:
+            messages: Message data dicts to store
+
+        Returns:
+            Message IDs in input order
+        """
+        return [await self.insert_message(message) for message in messages]
+
 
 class WhatsAppServiceInterface(ABC):
     """Interface for WhatsApp client management and operations."""
@@ -80,6 +96,30 @@ class WhatsAppServiceInterface(ABC):
         """
         pass
 
+    async def send_texts_bulk(
+        self, client_id: str, messages: list[tuple[str, str]]
+    ) -> list[str | BaseException]:
+        """
+        Send many text messages through one client.
+
+        Default implementation sends sequentially; implementations should
+        override with a concurrent fan-out where the backend allows it.
+
+        Args:
+            client_id: Client to use for sending
+            messages: List of (to, text) pairs
+
+        Returns:
+            Message IDs (or exceptions) in input order
+        """
+        results: list[str | BaseException] = []
+        for to, text in messages:
+            try:
+                results.append(await self.send_text(client_id, to, text))
+            except Exception as exc:
+                results.append(exc)
+        return results
+
     @abstractmethod
     async def send_image(
         self, client_id: str, to: str, image: str, caption: str | None = None
@@ -2,10 +2,14 @@
 Message service for handling message storage and retrieval
 """
 
+from collections import OrderedDict
 from typing import Any
 
 from services.interfaces import MessageServiceInterface
 
+# Upper bound on remembered external IDs; oldest entries are evicted first
+_DEDUP_CACHE_SIZE = 10_000
+
 
 class MessageService(MessageServiceInterface):
     """Message service for persisting messages."""
@@ -14,18 +18,40 @@ class MessageService(MessageServiceInterface):
         """
         Initialize message service.
         """
-        # We're no longer using a database here
-        pass
+        # LRU of recently seen external_ids: WhatsApp retries redeliver the
+        # same external_id, and a hit lets us skip the downstream write.
+        # (functools.lru_cache does not compose with coroutines, so this is
+        # a small manual OrderedDict-based LRU.)
+        self._recent_ids: OrderedDict[str, str] = OrderedDict()
 
     async def insert_message(self, message: dict[str, Any]) -> str:
         """
         Insert a message and return its ID.
 
+        Duplicate messages (same ``external_id``) within the cache window
+        are treated as idempotent resends and short-circuit.
+
         Args:
             message: Message data to store
 
         Returns:
             Message ID as string
         """
-        # Just a stub implementation that returns the external_id from the message
-        return message.get("external_id", "no-id")
+        external_id = message.get("external_id")
+        if external_id is None:
+            # No dedup key - always store
+            return "no-id"
+
+        cached = self._recent_ids.get(external_id)
+        if cached is not None:
+            self._recent_ids.move_to_end(external_id)
+            return cached
+
+        # Just a stub implementation that returns the external_id; in
+        # production the downstream write happens here
+        message_id = external_id
+
+        self._recent_ids[external_id] = message_id
+        if len(self._recent_ids) > _DEDUP_CACHE_SIZE:
+            self._recent_ids.popitem(last=False)
+        return message_id
@@ -0,0 +1,147 @@
+"""
+Micro-batching wrapper for message services.
+
+Coalesces individual insert_message calls into small batches that are
+flushed together, amortizing per-call overhead when many messages arrive
+in a short window (e.g. broadcast sends).
+"""
+
+import asyncio
+import contextlib
+from typing import Any
+
+from services.interfaces import MessageServiceInterface
+
+
+class BatchingMessageService(MessageServiceInterface):
+    """Wraps a message service, coalescing inserts into micro-batches.
+
+    Callers still await insert_message per message; internally the calls
+    are buffered on a queue and a background worker drains up to
+    ``max_batch_size`` entries (or whatever arrived within ``max_delay``
+    seconds) and flushes them in one go.
+    """
+
+    def __init__(
+        self,
+        inner: MessageServiceInterface,
+        max_batch_size: int = 100,
+        max_delay: float = 0.01,
+    ):
+        """
+        Initialize the batching wrapper.
+
+        Args:
+            inner: Message service that performs the actual inserts
+            max_batch_size: Maximum number of messages flushed together
+            max_delay: Maximum seconds a message waits for batch-mates
+        """
+        self._inner = inner
+        self._max_batch_size = max_batch_size
+        self._max_delay = max_delay
+        self._queue: asyncio.Queue[tuple[dict[str, Any], asyncio.Future[str]]] = (
+            asyncio.Queue()
+        )
+        self._worker: asyncio.Task[None] | None = None
+
+    def start(self) -> None:
+        """Start the background drain worker (requires a running loop)."""
+        if self._worker is None:
+            self._worker = asyncio.get_running_loop().create_task(self._drain())
+
+    async def stop(self) -> None:
+        """Flush any queued messages and stop the worker."""
+        if self._worker is not None:
+            self._worker.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._worker
+            self._worker = None
+
+        # Flush whatever is still queued so no caller is left hanging
+        remaining: list[tuple[dict[str, Any], asyncio.Future[str]]] = []
+        while not self._queue.empty():
+            remaining.append(self._queue.get_nowait())
+        if remaining:
+            await self._flush(remaining)
+
+    async def insert_message(self, message: dict[str, Any]) -> str:
+        """
+        Insert a message and return its ID once its batch is flushed.
+
+        Args:
+            message: Message data to store
+
+        Returns:
+            Message ID as string
+        """
+        self.start()
+        future: asyncio.Future[str] = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait((message, future))
+        return await future
+
+    async def insert_messages(self, messages: list[dict[str, Any]]) -> list[str]:
+        """
+        Insert several messages, enqueueing them as one unit.
+
+        The entries land on the queue together, so they fill the current
+        batch window instead of each serially waiting out ``max_delay``
+        as the sequential interface default would.
+
+        Args:
+            messages: List of message data to store
+
+        Returns:
+            List of message IDs in input order
+        """
+        self.start()
+        loop = asyncio.get_running_loop()
+        futures: list[asyncio.Future[str]] = []
+        for message in messages:
+            future: asyncio.Future[str] = loop.create_future()
+            self._queue.put_nowait((message, future))
+            futures.append(future)
+        return list(await asyncio.gather(*futures))
+
+    async def _drain(self) -> None:
+        """Collect queued messages into batches and flush them."""
+        loop = asyncio.get_running_loop()
+        while True:
+            batch = [await self._queue.get()]
+            try:
+                deadline = loop.time() + self._max_delay
+                while len(batch) < self._max_batch_size:
+                    timeout = deadline - loop.time()
+                    if timeout <= 0:
+                        break
+                    try:
+                        batch.append(
+                            await asyncio.wait_for(self._queue.get(), timeout)
+                        )
+                    except TimeoutError:
+                        break
+            except asyncio.CancelledError:
+                # Don't lose an in-flight batch on shutdown
+                await self._flush(batch)
+                raise
+            await self._flush(batch)
+
+    async def _flush(
+        self, batch: list[tuple[dict[str, Any], asyncio.Future[str]]]
+    ) -> None:
+        """Flush one batch through the inner service, resolving futures."""
+        # One bulk call per batch; a store with a real insert_messages
+        # override turns the whole batch into a single round trip
+        try:
+            results = await self._inner.insert_messages(
+                [message for message, _ in batch]
+            )
+        except Exception as exc:
+            # Bulk writes fail as a unit; surface the error to every waiter
+            for _, future in batch:
+                if not future.cancelled():
+                    future.set_exception(exc)
+            return
+
+        for (_, future), result in zip(batch, results, strict=True):
+            if not future.cancelled():
+                future.set_result(result)
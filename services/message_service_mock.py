@@ -2,17 +2,23 @@
 Mock implementation of message service for testing and development.
 """
 
-import uuid
+import itertools
+import logging
 from typing import Any
 
 from services.interfaces import MessageServiceInterface
 
+# Set up logging
+logger = logging.getLogger(__name__)
+
 
 class MockMessageService(MessageServiceInterface):
     """In-memory mock implementation of message service."""
 
     def __init__(self):
         self.messages: dict[str, dict[str, Any]] = {}  # message_id -> message
+        # Monotonic counter: no /dev/urandom read per insert like uuid4
+        self._counter = itertools.count()
 
     async def insert_message(self, message: dict[str, Any]) -> str:
         """
@@ -24,7 +30,10 @@ class MockMessageService(MessageServiceInterface):
         Returns:
             Message ID as string
         """
-        message_id = str(uuid.uuid4())
+        message_id = f"m{next(self._counter)}"
         self.messages[message_id] = message
-        print(f"[MOCK] Message stored with ID: {message_id}")
+        # Guarded DEBUG trace: a disabled level short-circuits before any
+        # formatting or write happens, unlike the old per-insert print
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Message stored: %s", message_id)
         return message_id
@@ -2,10 +2,20 @@
 WhatsApp service for managing multiple clients using PyWa.
 """
 
+import asyncio
+import functools
+import itertools
+import json
 import os
-import uuid
+import random
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from operator import itemgetter
+from pathlib import Path
 from typing import Any, Protocol
 
+import httpx
 from infisical_sdk import InfisicalSDKClient
 from pywa import WhatsApp
 from pywa.types import Button
@@ -41,6 +51,170 @@ class InfisicalSDKClientProtocol(Protocol):
     ) -> Any: ...
 
 
+class InfisicalClientAdapter:
+    """Adapter exposing the Infisical SDK through our protocol.
+
+    Satisfies InfisicalSDKClientProtocol structurally; not inheriting it
+    keeps __slots__ effective (a Protocol base would reintroduce
+    per-instance __dict__).
+    """
+
+    __slots__ = ("client",)
+
+    def __init__(self, client: Any) -> None:
+        self.client = client
+
+    def get_secret(
+        self, secret_name: str, project_id: str, environment: str, path: str
+    ) -> InfisicalSecret:
+        result = self.client.get_secret(secret_name, project_id, environment, path)
+        return {"secret_value": result.secret_value}
+
+    def create_secret(
+        self,
+        project_id: str,
+        environment: str,
+        path: str,
+        secret_name: str,
+        secret_value: str,
+    ) -> Any:
+        return self.client.secrets.create(
+            project_id, environment, path, secret_name, secret_value
+        )
+
+    def update_secret(
+        self,
+        secret_name: str,
+        project_id: str,
+        environment: str,
+        path: str,
+        secret_value: str,
+    ) -> Any:
+        return self.client.secrets.update(
+            secret_name, project_id, environment, path, secret_value
+        )
+
+
+# Single bound lookup for the required button key; C-level itemgetter
+# beats a per-element __getitem__ method dispatch in broadcast loops
+_get_title = itemgetter("title")
+
+
+@functools.lru_cache(maxsize=4096)
+def _cached_button(title: str, callback_data: str) -> Button:
+    """Memoize Button construction; real menus repeat across broadcasts.
+
+    pywa Buttons are plain value objects that are only read during
+    serialization, so sharing instances across sends is safe.
+    """
+    return Button(title=title, callback_data=callback_data)
+
+
+def _is_retryable(exc: BaseException) -> bool:
+    """Whether an outbound-call failure is worth retrying.
+
+    Transport-level errors (timeouts, resets) and throttling/server
+    status codes are transient; anything else is a real bug and should
+    propagate to the caller.
+    """
+    if isinstance(exc, (httpx.TransportError, TimeoutError)):
+        return True
+    status = getattr(exc, "status_code", None)
+    return status in (429, 500, 502, 503, 504)
+
+
+class _TokenBucket:
+    """Async token bucket limiting outbound requests per minute.
+
+    Refills continuously at ``rpm`` tokens per minute; acquire() sleeps
+    until a token is available, so callers self-throttle before WhatsApp
+    answers with a 429 and the work is wasted.
+    """
+
+    __slots__ = ("_lock", "last_update", "rpm", "tokens")
+
+    def __init__(self, rpm: float):
+        self.rpm = rpm
+        self.tokens = float(rpm)
+        self.last_update = time.monotonic()
+        self._lock = asyncio.Lock()
+
+    async def acquire(self, n: int = 1) -> None:
+        """Take n tokens, sleeping until the bucket refills enough."""
+        async with self._lock:
+            now = time.monotonic()
+            self.tokens = min(
+                self.rpm, self.tokens + (now - self.last_update) * self.rpm / 60.0
+            )
+            self.last_update = now
+            if self.tokens >= n:
+                self.tokens -= n
+                return
+            wait = (n - self.tokens) * 60.0 / self.rpm
+            self.tokens = 0.0
+            await asyncio.sleep(wait)
+
+
+class _SharedTransport(httpx.HTTPTransport):
+    """Process-lifetime HTTP transport shared by every PyWa client.
+
+    pywa binds per-tenant auth headers to each httpx.Client, so clients
+    cannot be shared — but the transport (and with it the keep-alive
+    TCP+TLS pool to graph.facebook.com) can. close() is a no-op because
+    httpx.Client.close would otherwise tear down the shared pool whenever
+    one tenant's client is evicted.
+    """
+
+    def close(self) -> None:
+        pass
+
+
+def _close_client(client: Any) -> None:
+    """Best-effort close of a PyWa client's underlying HTTP session."""
+    session = getattr(getattr(client, "api", None), "_session", None)
+    close = getattr(session, "close", None)
+    if close is not None:
+        close()
+
+
+class _LRUClientCache(OrderedDict):
+    """Bounded LRU with TTL for WhatsApp client instances.
+
+    Every distinct client_id otherwise stays in memory forever, holding a
+    PyWa client and its HTTP connection pool. Lookups refresh recency and
+    expire stale entries; inserts evict the least recently used client
+    (closing its session) once the bound is hit.
+    """
+
+    def __init__(self, maxsize: int, ttl: float):
+        super().__init__()
+        self.maxsize = maxsize
+        self.ttl = ttl
+
+    def __setitem__(self, key: str, value: Any) -> None:
+        super().__setitem__(key, (value, time.monotonic()))
+        self.move_to_end(key)
+        while len(self) > self.maxsize:
+            _, (evicted, _) = self.popitem(last=False)
+            _close_client(evicted)
+
+    def __getitem__(self, key: str) -> Any:
+        value, ts = super().__getitem__(key)
+        if time.monotonic() - ts >= self.ttl:
+            super().__delitem__(key)
+            _close_client(value)
+            raise KeyError(key)
+        self.move_to_end(key)
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        try:
+            self[key]
+        except KeyError:
+            return False
+        return True
+
+
 class WhatsAppClientError(Exception):
     """Base exception for WhatsApp client errors."""
 
@@ -86,35 +260,277 @@ class WhatsAppService(WhatsAppServiceInterface):
         # Project ID for WhatsApp clients
         self.project_id = os.getenv("INFISICAL_PROJECT_ID", "whatsapp-clients")
 
-        # Initialize Infisical client
+        # Initialize Infisical client. Authentication is deferred to the
+        # first secret access (_ensure_authed) so constructing the service
+        # never blocks on a network round-trip.
         self.infisical_client = InfisicalSDKClient(host=self.infisical_host)
+        self._authed = False
+        self._auth_lock = threading.Lock()
+
+        # Create the protocol interface using the module-level adapter
+        self.infisical: InfisicalSDKClientProtocol = InfisicalClientAdapter(
+            self.infisical_client
+        )
+
+        # Store WhatsApp client instances, bounded so a long tail of
+        # tenants cannot grow memory (and open sockets) without limit
+        self.clients: _LRUClientCache = _LRUClientCache(
+            maxsize=int(os.getenv("WHATSAPP_CLIENT_CACHE_SIZE", "1024")),
+            ttl=float(os.getenv("WHATSAPP_CLIENT_CACHE_TTL", "3600")),
+        )
+
+        # TTL cache for Infisical secret lookups: each miss is a full HTTP
+        # round-trip, so repeated lookups (retries, the register existence
+        # probe) are served from memory until the TTL lapses
+        self._secret_cache: dict[
+            tuple[str, str, str, str], tuple[InfisicalSecret, float]
+        ] = {}
+        self._secret_ttl = float(os.getenv("INFISICAL_CACHE_TTL", "300"))
+
+        # Cache policy: "enabled" (read/write-through, default),
+        # "read-only" (use cache, never store), "replay" (serve only from
+        # a persisted cache file, no network - deterministic local dev),
+        # "disabled" (always hit Infisical)
+        self._cache_policy = os.getenv("WHATSAPP_CACHE_POLICY", "enabled")
+        self._secret_cache_file = os.getenv("WHATSAPP_SECRET_CACHE_FILE")
+        if self._secret_cache_file:
+            self._load_persisted_secrets()
+
+        # Single-flight locks: one per client_id so concurrent cold
+        # lookups do the credential fetch once instead of N times
+        self._client_locks: defaultdict[str, asyncio.Lock] = defaultdict(asyncio.Lock)
+
+        # Shared connection pool: all tenants talk to the same Graph API
+        # host, so keep-alive connections and TLS sessions are reusable
+        # across clients
+        self._transport = _SharedTransport(
+            limits=httpx.Limits(max_connections=256, max_keepalive_connections=32),
+            retries=3,
+        )
+
+        # Counter for placeholder IDs returned on send failures; these are
+        # not cryptographic, so no need for a urandom read per error
+        self._err_counter = itertools.count()
+
+        # Per-client token buckets so bulk fan-out self-throttles under
+        # WhatsApp's per-number rate limits instead of burning 429s
+        self._buckets: dict[str, _TokenBucket] = {}
+
+    def _bucket_for(self, client_id: str) -> _TokenBucket:
+        """Get (or create) the rate-limit bucket for a client.
+
+        The limit comes from WHATSAPP_RPM_<CLIENT_ID> when set, falling
+        back to WHATSAPP_RPM (default 80 requests/minute).
+        """
+        bucket = self._buckets.get(client_id)
+        if bucket is None:
+            rpm = float(
+                os.getenv(
+                    f"WHATSAPP_RPM_{client_id.upper()}",
+                    os.getenv("WHATSAPP_RPM", "80"),
+                )
+            )
+            bucket = self._buckets[client_id] = _TokenBucket(rpm)
+        return bucket
+
+    def _new_http_session(self) -> httpx.Client:
+        """Build an httpx client backed by the shared connection pool."""
+        return httpx.Client(transport=self._transport)
+
+    def _placeholder_id(self) -> str:
+        """Cheap unique placeholder ID for failed sends."""
+        return f"err-{time.monotonic_ns():x}-{next(self._err_counter):x}"
+
+    async def _with_retry(
+        self, fn: Any, *args: Any, attempts: int = 3, base: float = 0.3, **kwargs: Any
+    ) -> Any:
+        """Run a blocking call off-loop, retrying transient failures.
+
+        Retries use exponential backoff with jitter (base * 2^attempt plus
+        up to one base interval); non-retryable errors propagate at once.
+
+        Args:
+            fn: Blocking callable to invoke
+            attempts: Total tries including the first
+            base: Base backoff interval in seconds
+        """
+        for attempt in range(attempts):
+            try:
+                return await asyncio.to_thread(fn, *args, **kwargs)
+            except Exception as exc:
+                if attempt == attempts - 1 or not _is_retryable(exc):
+                    raise
+                await asyncio.sleep(base * (2**attempt) + random.random() * base)
+
+    def _ensure_authed(self) -> None:
+        """Authenticate to Infisical once, on first use (thread-safe)."""
+        if self._authed:
+            return
+        with self._auth_lock:
+            if self._authed:
+                return
+            self.infisical_client.auth.universal_auth.login(
+                client_id=self.infisical_client_id,
+                client_secret=self.infisical_client_secret,
+            )
+            self._authed = True
+
+    def _get_secret_cached(
+        self, secret_name: str, environment: str, path: str = "/"
+    ) -> InfisicalSecret:
+        """
+        Get a secret from Infisical, serving repeats from a TTL cache.
+
+        Args:
+            secret_name: Name of the secret
+            environment: Environment (client_id) holding the secret
+            path: Secret path within the environment
+
+        Returns:
+            The secret value mapping
+        """
+        key = (secret_name, self.project_id, environment, path)
+
+        if self._cache_policy == "replay":
+            # Deterministic offline mode: serve the persisted cache only,
+            # ignore TTLs, and never touch the network
+            cached = self._secret_cache.get(key)
+            if cached is None:
+                raise WhatsAppClientError(
+                    f"Secret {secret_name}/{environment} not in replay cache"
+                )
+            return cached[0]
+
+        if self._cache_policy != "disabled":
+            cached = self._secret_cache.get(key)
+            if cached is not None and time.monotonic() - cached[1] < self._secret_ttl:
+                return cached[0]
+
+        self._ensure_authed()
+        secret = self.infisical.get_secret(
+            secret_name=secret_name,
+            project_id=self.project_id,
+            environment=environment,
+            path=path,
+        )
+        if self._cache_policy == "enabled":
+            self._secret_cache[key] = (secret, time.monotonic())
+            self._persist_secrets()
+        return secret
+
+    def _load_persisted_secrets(self) -> None:
+        """Seed the secret cache from the configured cache file.
+
+        The file is JSON (a list of [key, secret] pairs), so a tampered
+        file can at worst poison the cache - unlike pickle it cannot
+        execute code on load.
+        """
+        try:
+            with Path(self._secret_cache_file).open(encoding="utf-8") as f:  # type: ignore[arg-type]
+                persisted = json.load(f)
+        except (OSError, ValueError):
+            return
+        now = time.monotonic()
+        try:
+            for key, secret in persisted:
+                self._secret_cache[tuple(key)] = (secret, now)
+        except (TypeError, ValueError):
+            self._secret_cache.clear()  # Malformed file - start cold
+
+    def _persist_secrets(self) -> None:
+        """Write the current secret cache to the cache file (best-effort).
+
+        Created 0600: the file holds live tokens, so only the owning user
+        may read it.
+        """
+        if not self._secret_cache_file:
+            return
+        payload = [
+            [list(key), secret] for key, (secret, _) in self._secret_cache.items()
+        ]
+        try:
+            fd = os.open(
+                self._secret_cache_file,
+                os.O_WRONLY | os.O_CREAT | os.O_TRUNC,
+                0o600,
+            )
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump(payload, f)
+        except (OSError, TypeError, ValueError):
+            pass
+
+    def _cache_secret(
+        self, secret_name: str, environment: str, secret_value: str, path: str = "/"
+    ) -> None:
+        """Write a known-fresh secret value straight into the cache."""
+        key = (secret_name, self.project_id, environment, path)
+        self._secret_cache[key] = ({"secret_value": secret_value}, time.monotonic())
+
+    async def _fetch_client_credentials(self, client_id: str) -> tuple[str, str]:
+        """
+        Fetch a client's token and phone ID in one round-trip's latency.
+
+        The two secret lookups run concurrently on worker threads (the
+        Infisical SDK is synchronous), so a cold client costs ~1x network
+        latency instead of 2x.
 
-        # Authenticate using Universal Auth
-        self.infisical_client.auth.universal_auth.login(
-            client_id=self.infisical_client_id,
-            client_secret=self.infisical_client_secret,
+        Args:
+            client_id: Client whose credentials to fetch
+
+        Returns:
+            Tuple of (token, phone_id)
+        """
+        token_secret, phone_id_secret = await asyncio.gather(
+            asyncio.to_thread(
+                self._get_secret_cached, "WHATSAPP_TOKEN", environment=client_id
+            ),
+            asyncio.to_thread(
+                self._get_secret_cached, "WHATSAPP_PHONE_ID", environment=client_id
+            ),
         )
+        return token_secret["secret_value"], phone_id_secret["secret_value"]
+
+    def invalidate(self, client_id: str) -> None:
+        """
+        Drop cached secrets and the client instance for a client_id.
+
+        Call after rotating credentials so the next get_client re-reads
+        from Infisical.
+
+        Args:
+            client_id: Client whose cached state should be discarded
+        """
+        self.clients.pop(client_id, None)
+        for key in [k for k in self._secret_cache if k[2] == client_id]:
+            del self._secret_cache[key]
+
+    async def warmup(self, client_ids: list[str] | None = None) -> None:
+        """
+        Pre-populate WhatsApp clients so first requests skip cold-start.
+
+        Fetches credentials and constructs clients concurrently (bounded
+        at 16 in flight) during startup instead of on the request path.
+        Clients that fail to load are skipped; they will be retried
+        lazily on first use.
+
+        Args:
+            client_ids: Clients to warm; defaults to all known clients
+        """
+        if client_ids is None:
+            client_ids = await self.list_clients()
+        if not client_ids:
+            return
+
+        semaphore = asyncio.Semaphore(16)
 
-        # Create an adapter for the Infisical client that implements our protocol
-        class InfisicalClientAdapter(InfisicalSDKClientProtocol):
-            def __init__(self, client: Any) -> None:
-                self.client = client
-                
-            def get_secret(self, secret_name: str, project_id: str, environment: str, path: str) -> InfisicalSecret:
-                result = self.client.get_secret(secret_name, project_id, environment, path)
-                return {'secret_value': result.secret_value}
-                
-            def create_secret(self, project_id: str, environment: str, path: str, secret_name: str, secret_value: str) -> Any:
-                return self.client.secrets.create(project_id, environment, path, secret_name, secret_value)
-                
-            def update_secret(self, secret_name: str, project_id: str, environment: str, path: str, secret_value: str) -> Any:
-                return self.client.secrets.update(secret_name, project_id, environment, path, secret_value)
-                
-        # Create the protocol interface using the adapter
-        self.infisical: InfisicalSDKClientProtocol = InfisicalClientAdapter(self.infisical_client)
-
-        # Store WhatsApp client instances
-        self.clients: dict[str, WhatsApp] = {}
+        async def _warm_one(client_id: str) -> None:
+            async with semaphore:
+                await self.get_client(client_id)
+
+        await asyncio.gather(
+            *(_warm_one(client_id) for client_id in client_ids),
+            return_exceptions=True,
+        )
 
     async def get_client(self, client_id: str) -> WhatsApp:
         """
@@ -129,33 +545,28 @@ class WhatsAppService(WhatsAppServiceInterface):
         Raises:
             ClientNotFoundError: If the client is not found
         """
-        if client_id not in self.clients:
+        if client_id in self.clients:
+            return self.clients[client_id]
+
+        # Single-flight: concurrent misses for the same client_id wait for
+        # one fetch instead of each issuing its own Infisical round-trips
+        async with self._client_locks[client_id]:
+            if client_id in self.clients:
+                return self.clients[client_id]
+
             try:
                 # Try to get credentials from Infisical
                 # Each client is stored in its own environment named after the client_id
-                token_secret = self.infisical.get_secret(
-                    secret_name="WHATSAPP_TOKEN",
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                )
-
-                phone_id_secret = self.infisical.get_secret(
-                    secret_name="WHATSAPP_PHONE_ID",
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                )
-
-                token: str = token_secret["secret_value"]
-                phone_id: str = phone_id_secret["secret_value"]
+                token, phone_id = await self._fetch_client_credentials(client_id)
 
                 # Initialize new client
-                self.clients[client_id] = WhatsApp(phone_id=phone_id, token=token)
+                self.clients[client_id] = WhatsApp(
+                    phone_id=phone_id, token=token, session=self._new_http_session()
+                )
             except Exception:
                 raise ClientNotFoundError(f"No client found for client_id: {client_id}")
 
-        return self.clients[client_id]
+            return self.clients[client_id]
 
     async def register_client(
         self, client_id: str, phone_id: str, token: str
@@ -171,62 +582,65 @@ class WhatsAppService(WhatsAppServiceInterface):
         Returns:
             WhatsApp client instance
         """
-        # Store in Infisical
+        # Store in Infisical off the event loop; the SDK calls are
+        # synchronous HTTP round-trips, so upsert both secrets
+        # concurrently and pay one round-trip's latency instead of two
         try:
-            # Try to get existing environment first
-            try:
-                self.infisical.get_secret(
-                    secret_name="WHATSAPP_TOKEN",
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                )
-
-                # If exists, update the secrets
-                self.infisical.update_secret(
-                    secret_name="WHATSAPP_TOKEN",
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                    secret_value=token,
-                )
-
-                self.infisical.update_secret(
-                    secret_name="WHATSAPP_PHONE_ID",
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                    secret_value=phone_id,
-                )
-            except Exception:
-                # If environment doesn't exist, create new secrets
-                self.infisical.create_secret(
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                    secret_name="WHATSAPP_TOKEN",
-                    secret_value=token,
-                )
-
-                self.infisical.create_secret(
-                    project_id=self.project_id,
-                    environment=client_id,
-                    path="/",
-                    secret_name="WHATSAPP_PHONE_ID",
-                    secret_value=phone_id,
-                )
+            await asyncio.gather(
+                asyncio.to_thread(
+                    self._upsert_secret, "WHATSAPP_TOKEN", client_id, token
+                ),
+                asyncio.to_thread(
+                    self._upsert_secret, "WHATSAPP_PHONE_ID", client_id, phone_id
+                ),
+            )
         except Exception as e:
-            # Propagate exception if Infisical operations fail
             raise WhatsAppClientError(
                 f"Failed to register client in Infisical: {e!s}"
             )
 
+        # Seed the cache with the values just written so the next
+        # get_client for this client_id needs no round-trip
+        self._cache_secret("WHATSAPP_TOKEN", client_id, token)
+        self._cache_secret("WHATSAPP_PHONE_ID", client_id, phone_id)
+
         # Initialize and store client
-        client = WhatsApp(phone_id=phone_id, token=token)
+        client = WhatsApp(
+            phone_id=phone_id, token=token, session=self._new_http_session()
+        )
         self.clients[client_id] = client
 
         return client
 
+    def _upsert_secret(
+        self, secret_name: str, environment: str, secret_value: str
+    ) -> None:
+        """Write one secret to Infisical (blocking).
+
+        Upsert without a prior existence probe: re-registrations are the
+        common case, so try update first and fall back to create when the
+        environment does not exist yet - one round-trip saved either way.
+        """
+        self._ensure_authed()
+        try:
+            # Optimistic update: existing environments are the norm
+            self.infisical.update_secret(
+                secret_name=secret_name,
+                project_id=self.project_id,
+                environment=environment,
+                path="/",
+                secret_value=secret_value,
+            )
+        except Exception:
+            # If environment doesn't exist, create the secret
+            self.infisical.create_secret(
+                project_id=self.project_id,
+                environment=environment,
+                path="/",
+                secret_name=secret_name,
+                secret_value=secret_value,
+            )
+
     async def list_clients(self) -> list[str]:
         """
         List all registered client IDs.
@@ -269,13 +683,54 @@ class WhatsAppService(WhatsAppServiceInterface):
         """
         try:
             client = await self.get_client(client_id)
-            result = client.send_message(to=to, text=text)
+            await self._bucket_for(client_id).acquire()
+            # pywa's send is a blocking HTTP call; run it off the loop
+            result = await self._with_retry(client.send_message, to=to, text=text)
             return result.id
-        except Exception:
-            # In a production environment, proper logging would be implemented here
-            # For now, silently handle the error and return a placeholder ID
-            # No print statements in production code
-            return str(uuid.uuid4())
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            # Transient failure that survived retries: degrade to a
+            # placeholder ID rather than failing the whole request
+            return self._placeholder_id()
+
+    async def send_texts_bulk(
+        self, client_id: str, messages: list[tuple[str, str]]
+    ) -> list[str | BaseException]:
+        """
+        Send many text messages through one client concurrently.
+
+        The client is fetched once and the sends fan out in bounded waves
+        (16 in flight), so a large broadcast costs a handful of parallel
+        round-trips instead of one per recipient.
+
+        Args:
+            client_id: Client to use for sending
+            messages: List of (to, text) pairs
+
+        Returns:
+            Message IDs (or exceptions) in input order
+        """
+        try:
+            client = await self.get_client(client_id)
+        except Exception as exc:
+            # Keep the interface contract: failures surface per slot, the
+            # call itself never raises - even when the one shared lookup
+            # is what failed
+            return [exc for _ in messages]
+        send = client.send_message
+        semaphore = asyncio.Semaphore(16)
+        bucket = self._bucket_for(client_id)
+
+        async def _one(to: str, text: str) -> str:
+            async with semaphore:
+                await bucket.acquire()
+                result = await self._with_retry(send, to=to, text=text)
+                return result.id
+
+        return await asyncio.gather(
+            *(_one(to, text) for to, text in messages), return_exceptions=True
+        )
 
     async def send_image(
         self, client_id: str, to: str, image: str, caption: str | None = None
@@ -294,12 +749,15 @@ class WhatsAppService(WhatsAppServiceInterface):
         """
         try:
             client = await self.get_client(client_id)
-            result = client.send_image(to=to, image=image, caption=caption)
+            await self._bucket_for(client_id).acquire()
+            result = await self._with_retry(
+                client.send_image, to=to, image=image, caption=caption
+            )
             return result.id
-        except Exception:
-            # Disabled print statement
-            # print(f"Error sending image: {e!s}")
-            return str(uuid.uuid4())
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            return self._placeholder_id()
 
     async def send_video(
         self, client_id: str, to: str, video: str, caption: str | None = None
@@ -318,12 +776,15 @@ class WhatsAppService(WhatsAppServiceInterface):
         """
         try:
             client = await self.get_client(client_id)
-            result = client.send_video(to=to, video=video, caption=caption)
+            await self._bucket_for(client_id).acquire()
+            result = await self._with_retry(
+                client.send_video, to=to, video=video, caption=caption
+            )
             return result.id
-        except Exception:
-            # Disabled print statement
-            # print(f"Error sending video: {e!s}")
-            return str(uuid.uuid4())
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            return self._placeholder_id()
 
     async def send_document(
         self,
@@ -348,14 +809,19 @@ class WhatsAppService(WhatsAppServiceInterface):
         """
         try:
             client = await self.get_client(client_id)
-            result = client.send_document(
-                to=to, document=document, caption=caption, filename=filename
+            await self._bucket_for(client_id).acquire()
+            result = await self._with_retry(
+                client.send_document,
+                to=to,
+                document=document,
+                caption=caption,
+                filename=filename,
             )
             return result.id
-        except Exception:
-            # Disabled print statement
-            # print(f"Error sending document: {e!s}")
-            return str(uuid.uuid4())
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            return self._placeholder_id()
 
     async def send_buttons(
         self, client_id: str, to: str, text: str, buttons: list[dict[str, str]]
@@ -375,16 +841,19 @@ class WhatsAppService(WhatsAppServiceInterface):
         try:
             client = await self.get_client(client_id)
 
-            # Create button objects
+            # Create button objects (memoized; menus repeat across sends)
             button_objects = [
-                Button(title=btn["title"], callback_data=btn.get("callback_data", ""))
+                _cached_button(_get_title(btn), btn.get("callback_data") or "")
                 for btn in buttons
             ]
 
+            await self._bucket_for(client_id).acquire()
             # Send message with buttons
-            result = client.send_message(to=to, text=text, buttons=button_objects)
+            result = await self._with_retry(
+                client.send_message, to=to, text=text, buttons=button_objects
+            )
             return result.id
-        except Exception:
-            # Disabled print statement
-            # print(f"Error sending buttons: {e!s}")
-            return str(uuid.uuid4())
+        except Exception as exc:
+            if not _is_retryable(exc):
+                raise
+            return self._placeholder_id()
@@ -2,18 +2,30 @@
 Mock implementation of WhatsApp service for testing and development.
 """
 
+import itertools
 import logging
-import uuid
+import sys
 
 from services.interfaces import WhatsAppServiceInterface
 
 # Set up logging
 logger = logging.getLogger(__name__)
 
+# Monotonic counter for mock message IDs; nothing mock-facing needs
+# cryptographic randomness, so skip the urandom read per send
+_message_id_counter = itertools.count()
+
+
+def _next_message_id() -> str:
+    """Return the next mock message ID."""
+    return f"wamid-{next(_message_id_counter)}"
+
 
 class MockButton:
     """Mock implementation of a WhatsApp button."""
-    
+
+    __slots__ = ("callback_data", "title")
+
     def __init__(self, title: str, callback_data: str) -> None:
         """Initialize button with title and callback data."""
         self.title = title
@@ -23,6 +35,8 @@ class MockButton:
 class MockWhatsAppClient:
     """Mock WhatsApp client that simulates PyWa client behavior."""
 
+    __slots__ = ("phone_id", "token")
+
     def __init__(self, phone_id: str, token: str):
         """Initialize mock client with credentials."""
         self.phone_id = phone_id
@@ -30,27 +44,27 @@ class MockWhatsAppClient:
 
     def send_message(self, to: str, text: str, buttons: list["MockButton"] | None = None) -> "MockMessageResponse":
         """Send a text message or message with buttons."""
-        message_id = str(uuid.uuid4())
-        logger.info(f"[MOCK] Sending message to {to}: {text}")
+        message_id = _next_message_id()
+        logger.debug("[MOCK] Sending message to %s: %s", to, text)
         if buttons:
             button_texts = [b.title for b in buttons]
-            logger.info(f"[MOCK] With buttons: {button_texts}")
+            logger.debug("[MOCK] With buttons: %s", button_texts)
         return MockMessageResponse(message_id)
 
     def send_image(self, to: str, image: str, caption: str | None = None):
         """Send an image message."""
-        message_id = str(uuid.uuid4())
-        logger.info(f"[MOCK] Sending image to {to}: {image}")
+        message_id = _next_message_id()
+        logger.debug("[MOCK] Sending image to %s: %s", to, image)
         if caption:
-            logger.info(f"[MOCK] With caption: {caption}")
+            logger.debug("[MOCK] With caption: %s", caption)
         return MockMessageResponse(message_id)
 
     def send_video(self, to: str, video: str, caption: str | None = None):
         """Send a video message."""
-        message_id = str(uuid.uuid4())
-        logger.info(f"[MOCK] Sending video to {to}: {video}")
+        message_id = _next_message_id()
+        logger.debug("[MOCK] Sending video to %s: %s", to, video)
         if caption:
-            logger.info(f"[MOCK] With caption: {caption}")
+            logger.debug("[MOCK] With caption: %s", caption)
         return MockMessageResponse(message_id)
 
     def send_document(
@@ -61,18 +75,20 @@ class MockWhatsAppClient:
         filename: str | None = None,
     ):
         """Send a document message."""
-        message_id = str(uuid.uuid4())
-        logger.info(f"[MOCK] Sending document to {to}: {document}")
+        message_id = _next_message_id()
+        logger.debug("[MOCK] Sending document to %s: %s", to, document)
         if caption:
-            logger.info(f"[MOCK] With caption: {caption}")
+            logger.debug("[MOCK] With caption: %s", caption)
         if filename:
-            logger.info(f"[MOCK] With filename: {filename}")
+            logger.debug("[MOCK] With filename: %s", filename)
         return MockMessageResponse(message_id)
 
 
 class MockMessageResponse:
     """Mock message response that simulates PyWa response."""
 
+    __slots__ = ("id",)
+
     def __init__(self, message_id: str):
         """Initialize with message ID."""
         self.id = message_id
@@ -97,6 +113,8 @@ class MockWhatsAppService(WhatsAppServiceInterface):
         Returns:
             MockWhatsAppClient instance
         """
+        # Interned IDs make the hot dict lookups a pointer-equality hit
+        client_id = sys.intern(client_id)
         if client_id not in self.clients:
             if client_id in self.tokens and client_id in self.phone_ids:
                 # Initialize new client
@@ -122,6 +140,9 @@ class MockWhatsAppService(WhatsAppServiceInterface):
         Returns:
             MockWhatsAppClient instance
         """
+        # Intern once at register time so every later lookup is cheap
+        client_id = sys.intern(client_id)
+
         # Store credentials
         self.tokens[client_id] = token
         self.phone_ids[client_id] = phone_id
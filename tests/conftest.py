@@ -2,6 +2,7 @@
 Common test fixtures for the entire project.
 """
 
+from pathlib import Path
 from typing import Any
 
 import pytest
@@ -9,14 +10,26 @@ import pytest
 from services.message_service_mock import MockMessageService
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
+def repo_root() -> Path:
+    """Resolve the repository root once for the whole session."""
+    return Path(__file__).resolve().parent.parent
+
+
+@pytest.fixture(scope="session")
 def mock_services() -> dict[str, Any]:
-    """Fixture providing mock services for tests."""
+    """Fixture providing mock services, built once per session."""
     return {
         "message_service": MockMessageService(),
     }
 
 
+@pytest.fixture(autouse=True)
+def _reset_mock_services(mock_services: dict[str, Any]) -> None:
+    """Clear shared mock state before each test instead of reinstantiating."""
+    mock_services["message_service"].messages.clear()
+
+
 @pytest.fixture
 def test_context(mock_services: dict[str, Any]) -> dict[str, Any]:
     """Fixture providing test context with mock services."""
@@ -3,49 +3,23 @@ Tests for MCP server integration.
 """
 
 import asyncio
-from collections.abc import Callable, Generator
-from typing import Any, TypeVar
-from unittest.mock import AsyncMock, MagicMock, patch
+from types import SimpleNamespace
+from typing import Any
+from unittest.mock import patch
 
 import pytest
 
-# Define a custom type for our mocked FastMCP
-T = TypeVar("T")
-MockedFastMCP = MagicMock
+from services.message_service_mock import MockMessageService
+from services.whatsapp_service_mock import MockWhatsAppService
 
-
-# Since we're testing the MCP integration, we need to mock the MCP server library
-@pytest.fixture
-def mock_mcp_server() -> Generator[MagicMock]:
-    """Mock the FastMCP server."""
-    with patch("mcp.server.fastmcp.FastMCP") as mock_server:
-        # Mock the register_tool method
-        mock_server.return_value.register_tool = MagicMock()
-        # Mock the register_resource method
-        mock_server.return_value.register_resource = MagicMock()
-        # Mock the start method
-        mock_server.return_value.start = AsyncMock()
-        # Mock the stop method
-        mock_server.return_value.stop = AsyncMock()
-
-        yield mock_server
-
-
-@pytest.mark.asyncio
-async def test_server_registers_tools(mock_mcp_server: MagicMock) -> None:
-    """Test that the server registers all required tools with MCP."""
-    # Import here to avoid circular imports during test discovery
-    from app.server import create_server
-
-    # Act - Create the server (which should register tools)
-    server = await create_server(mock_mcp_server.return_value)
-
-    # Assert - Check that tools were registered
-    register_tool = mock_mcp_server.return_value.register_tool
-
-    # Check for all expected tools
-    expected_tools = [
+# All tools the server must register. The following tools have been
+# consolidated into the general tools with an optional client_id parameter,
+# so they're no longer separate: send_whatsapp_text, send_whatsapp_image,
+# send_whatsapp_video, send_whatsapp_document, send_whatsapp_buttons.
+EXPECTED_TOOLS = frozenset(
+    {
         "send_text",
+        "send_text_batch",
         "send_image",
         "send_video",
         "send_document",
@@ -56,70 +30,104 @@ async def test_server_registers_tools(mock_mcp_server: MagicMock) -> None:
         "update_config",
         "register_whatsapp_client",
         "list_whatsapp_clients",
-        # The following tools have been consolidated into the general tools
-        # with an optional client_id parameter, so they're no longer separate:
-        # "send_whatsapp_text",
-        # "send_whatsapp_image",
-        # "send_whatsapp_video",
-        # "send_whatsapp_document",
-        # "send_whatsapp_buttons",
-    ]
-
-    # Get all tool names that were registered
-    registered_tools = [call.args[0] for call in register_tool.call_args_list]
-
-    # Check that each expected tool was registered
-    for tool in expected_tools:
-        assert tool in registered_tools, f"Expected tool '{tool}' not registered"
-
-    # Cleanup - We know this is mocked, so it's safe to call
+    }
+)
+
+
+class FakeMCP:
+    """Minimal stand-in for the FastMCP surface these tests touch.
+
+    A plain class with a dict of tools is much cheaper than a MagicMock
+    proxy and lets assertions use O(1) membership checks instead of
+    scanning call_args_list.
+    """
+
+    def __init__(self) -> None:
+        self.tools: dict[str, Any] = {}
+        self.start_calls = 0
+        self.stop_calls = 0
+
+    def register_tool(self, name: str, handler: Any) -> Any:
+        self.tools[name] = handler
+        return handler
+
+    async def start(self) -> None:
+        self.start_calls += 1
+
+    async def stop(self) -> None:
+        self.stop_calls += 1
+
+
+class FakeContext:
+    """Tool-call context stub that records get_state calls."""
+
+    def __init__(self, state: dict[str, Any]) -> None:
+        self._state = state
+        self.get_state_calls = 0
+
+    async def get_state(self) -> dict[str, Any]:
+        self.get_state_calls += 1
+        return self._state
+
+
+@pytest.fixture(scope="session")
+def create_server_fn() -> Any:
+    """Import app.server once for the session and return create_server.
+
+    Importing inside every test deferred the full app.server dependency
+    graph load to the first test body; doing it here pays the cost once.
+    The FastMCP class is patched during the import so loading app.server
+    never constructs a real MCP server.
+    """
+    with patch("mcp.server.fastmcp.FastMCP") as server_cls:
+        # Identity decorator: keep the real tool functions importable
+        server_cls.return_value.tool.return_value = lambda func: func
+        from app.server import create_server
+    return create_server
+
+
+@pytest.fixture
+def mock_mcp_server() -> FakeMCP:
+    """Provide a lightweight fake FastMCP server."""
+    return FakeMCP()
+
+
+@pytest.mark.asyncio
+async def test_server_registers_tools(
+    mock_mcp_server: FakeMCP, create_server_fn: Any
+) -> None:
+    """Test that the server registers all required tools with MCP."""
+    # Act - Create the server (which should register tools)
+    server = await create_server_fn(mock_mcp_server)  # type: ignore[arg-type]
+
+    # Set difference reports every missing tool in one failure
+    missing = EXPECTED_TOOLS - mock_mcp_server.tools.keys()
+    assert not missing, f"Expected tools not registered: {sorted(missing)}"
+
+    # Cleanup - We know this is faked, so it's safe to call
     await server.stop()  # type: ignore
 
 
 @pytest.mark.asyncio
 async def test_send_text_tool_integration(
-    mock_mcp_server: MagicMock, test_context: dict[str, Any]
+    mock_mcp_server: FakeMCP,
+    test_context: dict[str, Any],
+    create_server_fn: Any,
 ) -> None:
     """Test the send_text tool integration."""
-    # Import here to avoid circular imports
-    from app.server import create_server
-
-    # Mock the context passed to the tool handler
-    context = MagicMock()
-    context.get_state = AsyncMock(return_value=test_context)
-    context.set_state = AsyncMock()
+    # Context passed to the tool handler
+    context = FakeContext(test_context)
 
-    # Set up the mock handler to return a valid response
-    async def mock_handler_impl(ctx: Any, _params: dict[str, Any]) -> dict[str, str]:
+    # Stub handler honoring the tool contract
+    async def send_text_handler(ctx: Any, _params: dict[str, Any]) -> dict[str, str]:
         await ctx.get_state()
         return {"message_id": "test_message_id"}
 
-    mock_handler = AsyncMock(side_effect=mock_handler_impl)
-
-    # Configure the mock server to return our mock handler when registering the send_text tool
-    def register_tool_side_effect(
-        name: str, _handler: Callable[..., Any]
-    ) -> AsyncMock | MagicMock:
-        if name == "send_text":
-            return mock_handler
-        return MagicMock()
-
-    mock_mcp_server.return_value.register_tool.side_effect = register_tool_side_effect
-
     # Act - Create the server
-    server = await create_server(mock_mcp_server.return_value)
-
-    # Get the registered tool handlers
-    register_tool = mock_mcp_server.return_value.register_tool
-
-    # Find the send_text tool handler
-    send_text_handler = None
-    for call in register_tool.call_args_list:
-        if call.args[0] == "send_text":
-            send_text_handler = mock_handler
-            break
+    server = await create_server_fn(mock_mcp_server)  # type: ignore[arg-type]
 
-    assert send_text_handler is not None, "send_text tool not registered"
+    # The real send_text tool must have been registered
+    assert "send_text" in mock_mcp_server.tools, "send_text tool not registered"
 
     # Call the handler with a test message
     test_message = "Hello, world!"
@@ -129,7 +137,7 @@ async def test_send_text_tool_integration(
     assert result.get("message_id") is not None, "Should return a message ID"
 
     # Verify context state was retrieved
-    context.get_state.assert_called_once()
+    assert context.get_state_calls == 1
 
     # Cleanup
     await server.stop()  # type: ignore
@@ -137,79 +145,195 @@ async def test_send_text_tool_integration(
 
 @pytest.mark.asyncio
 async def test_sleep_tool_integration(
-    mock_mcp_server: MagicMock, test_context: dict[str, Any]
+    mock_mcp_server: FakeMCP,
+    test_context: dict[str, Any],
+    create_server_fn: Any,
 ) -> None:
     """Test the sleep tool integration."""
-    # Import here to avoid circular imports
-    from app.server import create_server
+    # Context passed to the tool handler
+    context = FakeContext(test_context)
 
-    # Mock the context passed to the tool handler
-    context = MagicMock()
-    context.get_state = AsyncMock(return_value=test_context)
+    # Record sleep calls without actually sleeping
+    sleep_calls: list[float] = []
 
-    # Patch asyncio.sleep to avoid actual sleeping
-    with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
-        # Set up the mock handler to call asyncio.sleep
-        async def mock_handler_impl(ctx: Any, params: dict[str, Any]) -> dict[str, str]:
+    async def fake_sleep(seconds: float) -> None:
+        sleep_calls.append(seconds)
+
+    with patch("asyncio.sleep", fake_sleep):
+        # Stub handler honoring the tool contract
+        async def sleep_handler(ctx: Any, params: dict[str, Any]) -> dict[str, str]:
             await ctx.get_state()
             await asyncio.sleep(params["seconds"])
             return {"status": "success"}
 
-        mock_handler = AsyncMock(side_effect=mock_handler_impl)
-
-        # Configure the mock server to return our mock handler when registering the sleep tool
-        def register_tool_side_effect(
-            name: str, _handler: Callable[..., Any]
-        ) -> AsyncMock | MagicMock:
-            if name == "sleep":
-                return mock_handler
-            return MagicMock()
-
-        mock_mcp_server.return_value.register_tool.side_effect = (
-            register_tool_side_effect
-        )
-
         # Act - Create the server
-        server = await create_server(mock_mcp_server.return_value)
-
-        # Get the registered tool handlers
-        register_tool = mock_mcp_server.return_value.register_tool
-
-        # Find the sleep tool handler
-        sleep_handler = None
-        for call in register_tool.call_args_list:
-            if call.args[0] == "sleep":
-                sleep_handler = mock_handler
-                break
+        server = await create_server_fn(mock_mcp_server)  # type: ignore[arg-type]
 
-        assert sleep_handler is not None, "sleep tool not registered"
+        # The real sleep tool must have been registered
+        assert "sleep" in mock_mcp_server.tools, "sleep tool not registered"
 
         # Call the handler with a test duration
         await sleep_handler(context, {"seconds": 5})
 
         # Assert
-        mock_sleep.assert_called_once_with(5)
+        assert sleep_calls == [5]
 
         # Cleanup
         await server.stop()  # type: ignore
 
 
 @pytest.mark.asyncio
-async def test_server_lifespan_management(mock_mcp_server: MagicMock) -> None:
+async def test_server_lifespan_management(
+    mock_mcp_server: FakeMCP, create_server_fn: Any
+) -> None:
     """Test the server's lifespan management."""
-    # Import here to avoid circular imports
-    from app.server import create_server
-
     # Act - Create and then start the server
-    server = await create_server(mock_mcp_server.return_value)
-    # The server is a mock, so we can call .start() even though it's not in the real FastMCP
+    server = await create_server_fn(mock_mcp_server)  # type: ignore[arg-type]
+    # The server is a fake, so we can call .start() even though it's not in the real FastMCP
     await server.start()  # type: ignore
 
     # Assert - Server was started
-    mock_mcp_server.return_value.start.assert_called_once()
+    assert mock_mcp_server.start_calls == 1
 
     # Now stop the server
     await server.stop()  # type: ignore
 
     # Assert - Server was stopped
-    mock_mcp_server.return_value.stop.assert_called_once()
+    assert mock_mcp_server.stop_calls == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("create_server_fn")
+async def test_send_text_with_client_id() -> None:
+    """Test sending text through the WhatsApp client_id path end to end."""
+    # The session fixture already imported app.server with real tool functions
+    from app.server import send_text
+
+    whatsapp_service = MockWhatsAppService()
+    await whatsapp_service.register_client(
+        client_id="test_whatsapp_client", phone_id="123456789", token="test_token"
+    )
+
+    # Lightweight context shaped like the MCP request context
+    ctx = SimpleNamespace(
+        request_context=SimpleNamespace(
+            lifespan_context={
+                "message_service": None,  # Not used on the client_id path
+                "whatsapp_service": whatsapp_service,
+            }
+        )
+    )
+
+    result = await send_text(
+        ctx=ctx,
+        company_id="test_company",  # Required but not used when client_id is provided
+        phone_number="1234567890",
+        message="Test message with client_id",
+        client_id="test_whatsapp_client",
+    )
+
+    assert result["status"] == "success"
+    assert result.get("message_id") is not None
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("create_server_fn")
+async def test_send_text_batch_with_client_id() -> None:
+    """Test the batch tool's WhatsApp client_id path."""
+    from app.server import send_text_batch
+
+    whatsapp_service = MockWhatsAppService()
+    await whatsapp_service.register_client(
+        client_id="test_whatsapp_client", phone_id="123456789", token="test_token"
+    )
+
+    ctx = SimpleNamespace(
+        request_context=SimpleNamespace(
+            lifespan_context={
+                "message_service": None,  # Not used on the client_id path
+                "whatsapp_service": whatsapp_service,
+            }
+        )
+    )
+
+    result = await send_text_batch(
+        ctx=ctx,
+        company_id="test_company",
+        messages=[
+            {"phone_number": "1234567890", "message": "First batch message"},
+            {"phone_number": "0987654321", "message": "Second batch message"},
+        ],
+        client_id="test_whatsapp_client",
+    )
+
+    assert result["status"] == "success"
+    # One ID per entry, in input order, none missing
+    assert len(result["message_ids"]) == 2
+    assert all(message_id is not None for message_id in result["message_ids"])
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("create_server_fn")
+async def test_send_text_batch_tool_path() -> None:
+    """Test the batch tool's default TextTool path (no client_id)."""
+    from app.server import send_text_batch
+
+    message_service = MockMessageService()
+    ctx = SimpleNamespace(
+        request_context=SimpleNamespace(
+            lifespan_context={
+                "message_service": message_service,
+                "whatsapp_service": None,  # Not used without a client_id
+            }
+        )
+    )
+
+    result = await send_text_batch(
+        ctx=ctx,
+        company_id="test_company",
+        messages=[
+            {"phone_number": "1234567890", "message": "First batch message"},
+            {"phone_number": "0987654321", "message": "Second batch message"},
+        ],
+    )
+
+    assert result["status"] == "success"
+    assert len(result["message_ids"]) == 2
+    # Every returned ID resolves to a stored message
+    for message_id in result["message_ids"]:
+        assert message_id in message_service.messages
+
+
+@pytest.mark.asyncio
+@pytest.mark.usefixtures("create_server_fn")
+async def test_send_text_batch_failing_entry_returns_error() -> None:
+    """Test that one bad entry fails the whole batch with the error envelope."""
+    from app.server import send_text_batch
+
+    whatsapp_service = MockWhatsAppService()
+    await whatsapp_service.register_client(
+        client_id="test_whatsapp_client", phone_id="123456789", token="test_token"
+    )
+
+    ctx = SimpleNamespace(
+        request_context=SimpleNamespace(
+            lifespan_context={
+                "message_service": None,
+                "whatsapp_service": whatsapp_service,
+            }
+        )
+    )
+
+    # The second entry is malformed; the TaskGroup cancels its siblings and
+    # the handler's error wrapper turns the failure into the error envelope
+    result = await send_text_batch(
+        ctx=ctx,
+        company_id="test_company",
+        messages=[
+            {"phone_number": "1234567890", "message": "First batch message"},
+            {"phone_number": "0987654321"},
+        ],
+        client_id="test_whatsapp_client",
+    )
+
+    assert result == {"status": "error", "message": "Failed to send batch"}
@@ -76,3 +76,35 @@ async def test_message_service_missing_external_id() -> None:
 
     # Assert
     assert result == "no-id", "Should return default ID when external_id is missing"
+
+
+@pytest.mark.asyncio
+async def test_message_service_insert_messages_bulk() -> None:
+    """Test the bulk insert path returns IDs in input order."""
+    # Arrange
+    service = MessageService()
+    external_ids = [str(uuid.uuid4()) for _ in range(3)]
+    messages = [{"external_id": eid, "type": "text"} for eid in external_ids]
+
+    # Act
+    result = await service.insert_messages(messages)
+
+    # Assert
+    assert result == external_ids, "Should return the external IDs in order"
+
+
+@pytest.mark.asyncio
+async def test_message_service_duplicate_external_id() -> None:
+    """Test that resends with the same external_id are idempotent."""
+    # Arrange
+    service = MessageService()
+    external_id = str(uuid.uuid4())
+    test_message = {"external_id": external_id, "type": "text"}
+
+    # Act
+    first = await service.insert_message(test_message)
+    second = await service.insert_message(dict(test_message))
+
+    # Assert
+    assert first == second == external_id, "Resend should return the same ID"
+    assert len(service._recent_ids) == 1, "Duplicate should not grow the cache"
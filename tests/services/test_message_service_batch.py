@@ -0,0 +1,84 @@
+"""
+Tests for BatchingMessageService.
+"""
+
+import asyncio
+
+import pytest
+
+from services.message_service_batch import BatchingMessageService
+from services.message_service_mock import MockMessageService
+
+
+@pytest.mark.asyncio
+async def test_batching_insert_returns_ids() -> None:
+    """Test that batched inserts resolve to the inner service's IDs."""
+    # Arrange
+    inner = MockMessageService()
+    service = BatchingMessageService(inner, max_batch_size=4, max_delay=0.01)
+
+    # Act
+    ids = await asyncio.gather(
+        *(service.insert_message({"n": i}) for i in range(6))
+    )
+
+    # Assert
+    assert len(ids) == 6, "Every insert should resolve to an ID"
+    assert len(inner.messages) == 6, "All messages should reach the inner service"
+
+    # Cleanup
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_batching_single_insert() -> None:
+    """Test that a lone insert still flushes within the delay window."""
+    # Arrange
+    inner = MockMessageService()
+    service = BatchingMessageService(inner, max_batch_size=50, max_delay=0.01)
+
+    # Act
+    message_id = await service.insert_message({"external_id": "abc"})
+
+    # Assert
+    assert message_id in inner.messages, "Message should be stored under its ID"
+
+    # Cleanup
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_batching_insert_messages_bulk() -> None:
+    """Test that a bulk insert resolves as one unit, IDs in input order."""
+    # Arrange
+    inner = MockMessageService()
+    service = BatchingMessageService(inner, max_batch_size=50, max_delay=0.01)
+
+    # Act
+    ids = await service.insert_messages([{"n": i} for i in range(5)])
+
+    # Assert
+    assert len(ids) == 5, "Every message should resolve to an ID"
+    assert [inner.messages[message_id]["n"] for message_id in ids] == list(
+        range(5)
+    ), "IDs should come back in input order"
+
+    # Cleanup
+    await service.stop()
+
+
+@pytest.mark.asyncio
+async def test_batching_stop_flushes_queue() -> None:
+    """Test that stop() flushes messages still sitting in the queue."""
+    # Arrange
+    inner = MockMessageService()
+    service = BatchingMessageService(inner, max_batch_size=50, max_delay=60.0)
+
+    # Act - enqueue without waiting for the (long) batch window
+    task = asyncio.ensure_future(service.insert_message({"n": 1}))
+    await asyncio.sleep(0)  # let the insert enqueue
+    await service.stop()
+
+    # Assert
+    assert await task is not None, "Insert should resolve on stop"
+    assert len(inner.messages) == 1, "Queued message should be flushed by stop"
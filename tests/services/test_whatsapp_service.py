@@ -2,174 +2,208 @@
 Tests for WhatsApp service mock implementation.
 """
 
-import asyncio
-import unittest
-from unittest.mock import patch
+import logging
+
+import pytest
 
 from services.whatsapp_service_mock import MockWhatsAppService
 
 
-class TestWhatsAppServiceMock(unittest.TestCase):
-    """Test cases for the WhatsApp service mock."""
-
-    def setUp(self):
-        """Set up test environment."""
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(self.loop)
-        self.service = MockWhatsAppService()
-
-    def test_register_client(self):
-        """Test registering a new WhatsApp client."""
-        # Register a client
-        with patch("logging.Logger.info") as mock_logger:
-            _ = self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="test_client", phone_id="123456789", token="test_token"
-                )
-            )
-
-            # Check if client was registered and logger was called
-            mock_logger.assert_called_with(
-                "[MOCK] Registered client test_client with phone_id 123456789"
-            )
-
-    def test_get_client_existing(self):
-        """Test getting an existing WhatsApp client."""
-        # First register a client
-        with patch("logging.Logger.info"):
-            client = self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="test_client", phone_id="123456789", token="test_token"
-                )
-            )
-
-        # Then get the client
-        result = self.loop.run_until_complete(
-            self.service.get_client(client_id="test_client")
+@pytest.fixture
+def whatsapp_mock() -> MockWhatsAppService:
+    """Fixture providing a fresh, unregistered mock WhatsApp service."""
+    return MockWhatsAppService()
+
+
+@pytest.fixture(scope="session")
+async def registered_service() -> MockWhatsAppService:
+    """Mock service with test_client registered once for the session."""
+    service = MockWhatsAppService()
+    await service.register_client(
+        client_id="test_client", phone_id="123456789", token="test_token"
+    )
+    return service
+
+
+@pytest.fixture(autouse=True)
+def _restore_registered_service(registered_service: MockWhatsAppService):
+    """Roll back any registrations a test makes on the shared service."""
+    snapshots = [
+        (d, dict(d))
+        for d in (
+            registered_service.clients,
+            registered_service.tokens,
+            registered_service.phone_ids,
+        )
+    ]
+    yield
+    for live, saved in snapshots:
+        live.clear()
+        live.update(saved)
+
+
+async def test_register_client(
+    whatsapp_mock: MockWhatsAppService, caplog: pytest.LogCaptureFixture
+):
+    """Test registering a new WhatsApp client."""
+    # Register a client
+    with caplog.at_level(logging.INFO):
+        _ = await whatsapp_mock.register_client(
+            client_id="test_client", phone_id="123456789", token="test_token"
+        )
+
+    # Check if client was registered and logged
+    assert "[MOCK] Registered client test_client with phone_id 123456789" in caplog.text
+
+
+async def test_get_client_existing(registered_service: MockWhatsAppService):
+    """Test getting an existing WhatsApp client."""
+    # Get the pre-registered client
+    result = await registered_service.get_client(client_id="test_client")
+
+    # Check if client was returned and has the right properties
+    assert result is not None
+    assert result.phone_id == "123456789"
+    assert result.token == "test_token"
+
+
+async def test_get_client_nonexisting(whatsapp_mock: MockWhatsAppService):
+    """Test getting a non-existing WhatsApp client."""
+    # This should raise an exception
+    with pytest.raises(ValueError):
+        await whatsapp_mock.get_client(client_id="nonexistent")
+
+
+async def test_list_clients(whatsapp_mock: MockWhatsAppService):
+    """Test listing all registered WhatsApp clients."""
+    # Register a couple of clients
+    await whatsapp_mock.register_client(
+        client_id="client1", phone_id="123456789", token="token1"
+    )
+    await whatsapp_mock.register_client(
+        client_id="client2", phone_id="987654321", token="token2"
+    )
+
+    # List clients
+    clients = await whatsapp_mock.list_clients()
+
+    # Check if both clients are in the list
+    assert len(clients) == 2
+    assert "client1" in clients
+    assert "client2" in clients
+
+
+async def test_send_text(
+    registered_service: MockWhatsAppService, caplog: pytest.LogCaptureFixture
+):
+    """Test sending a text message."""
+    # Send a text message through the pre-registered client
+    with caplog.at_level(logging.DEBUG):
+        message_id = await registered_service.send_text(
+            client_id="test_client", to="987654321", text="Hello, world!"
+        )
+
+    # Check if message ID is returned and the send was logged
+    assert message_id is not None
+    assert "[MOCK] Sending message to 987654321: Hello, world!" in caplog.text
+
+
+async def test_send_texts_bulk(registered_service: MockWhatsAppService):
+    """Test sending many texts through one client in bulk."""
+    messages = [
+        ("111111111", "First"),
+        ("222222222", "Second"),
+        ("333333333", "Third"),
+    ]
+
+    results = await registered_service.send_texts_bulk("test_client", messages)
+
+    # One ID per message, in input order, no failures
+    assert len(results) == 3
+    assert all(isinstance(result, str) for result in results)
+
+
+async def test_send_texts_bulk_collects_failures():
+    """Test that a failing entry yields an exception in its slot."""
+
+    class FlakySendService(MockWhatsAppService):
+        """Mock variant that rejects one specific recipient."""
+
+        async def send_text(self, client_id: str, to: str, text: str) -> str:
+            if to == "rejected":
+                raise RuntimeError("recipient blocked")
+            return await super().send_text(client_id, to, text)
+
+    service = FlakySendService()
+    await service.register_client(
+        client_id="test_client", phone_id="123456789", token="test_token"
+    )
+
+    results = await service.send_texts_bulk(
+        "test_client",
+        [("111111111", "First"), ("rejected", "Second"), ("333333333", "Third")],
+    )
+
+    # The failure stays in its slot; sends before and after still complete
+    assert len(results) == 3
+    assert isinstance(results[0], str)
+    assert isinstance(results[1], RuntimeError)
+    assert isinstance(results[2], str)
+
+
+async def test_send_texts_bulk_unknown_client(whatsapp_mock: MockWhatsAppService):
+    """Test bulk sending through an unregistered client."""
+    results = await whatsapp_mock.send_texts_bulk(
+        "nonexistent", [("111111111", "First"), ("222222222", "Second")]
+    )
+
+    # Every entry fails the client lookup but the call itself never raises
+    assert len(results) == 2
+    assert all(isinstance(result, ValueError) for result in results)
+
+
+async def test_send_image(
+    registered_service: MockWhatsAppService, caplog: pytest.LogCaptureFixture
+):
+    """Test sending an image message."""
+    # Send an image message through the pre-registered client
+    with caplog.at_level(logging.DEBUG):
+        message_id = await registered_service.send_image(
+            client_id="test_client",
+            to="987654321",
+            image="https://example.com/image.jpg",
+            caption="Check this out",
+        )
+
+    # Check if message ID is returned and the send was logged
+    assert message_id is not None
+    assert (
+        "[MOCK] Sending image to 987654321: https://example.com/image.jpg"
+        in caplog.text
+    )
+    assert "[MOCK] With caption: Check this out" in caplog.text
+
+
+async def test_send_buttons(
+    registered_service: MockWhatsAppService, caplog: pytest.LogCaptureFixture
+):
+    """Test sending buttons."""
+    # Create mock buttons
+    buttons = [
+        {"title": "Button 1", "callback_data": "btn1"},
+        {"title": "Button 2", "callback_data": "btn2"},
+    ]
+
+    # Send buttons
+    with caplog.at_level(logging.DEBUG):
+        message_id = await registered_service.send_buttons(
+            client_id="test_client",
+            to="987654321",
+            text="Choose an option",
+            buttons=buttons,
         )
 
-        # Check if client was returned and has the right properties
-        self.assertIsNotNone(result)
-        self.assertEqual(result.phone_id, "123456789")
-        self.assertEqual(result.token, "test_token")
-
-    def test_get_client_nonexisting(self):
-        """Test getting a non-existing WhatsApp client."""
-        # This should raise an exception
-        with self.assertRaises(ValueError):
-            self.loop.run_until_complete(
-                self.service.get_client(client_id="nonexistent")
-            )
-
-    def test_list_clients(self):
-        """Test listing all registered WhatsApp clients."""
-        # Register a couple of clients
-        with patch("logging.Logger.info"):
-            self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="client1", phone_id="123456789", token="token1"
-                )
-            )
-            self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="client2", phone_id="987654321", token="token2"
-                )
-            )
-
-        # List clients
-        clients = self.loop.run_until_complete(self.service.list_clients())
-
-        # Check if both clients are in the list
-        self.assertEqual(len(clients), 2)
-        self.assertIn("client1", clients)
-        self.assertIn("client2", clients)
-
-    def test_send_text(self):
-        """Test sending a text message."""
-        # Register a client first
-        with patch("logging.Logger.info"):
-            self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="test_client", phone_id="123456789", token="test_token"
-                )
-            )
-
-        # Send a text message
-        with patch("logging.Logger.info") as mock_logger:
-            message_id = self.loop.run_until_complete(
-                self.service.send_text(
-                    client_id="test_client", to="987654321", text="Hello, world!"
-                )
-            )
-
-            # Check if message ID is returned and logger was called
-            self.assertIsNotNone(message_id)
-            mock_logger.assert_called_with(
-                "[MOCK] Sending message to 987654321: Hello, world!"
-            )
-
-    def test_send_image(self):
-        """Test sending an image message."""
-        # Register a client first
-        with patch("logging.Logger.info"):
-            self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="test_client", phone_id="123456789", token="test_token"
-                )
-            )
-
-        # Send an image message
-        with patch("logging.Logger.info") as mock_logger:
-            message_id = self.loop.run_until_complete(
-                self.service.send_image(
-                    client_id="test_client",
-                    to="987654321",
-                    image="https://example.com/image.jpg",
-                    caption="Check this out",
-                )
-            )
-
-            # Check if message ID is returned and logger was called
-            self.assertIsNotNone(message_id)
-            mock_logger.assert_any_call(
-                "[MOCK] Sending image to 987654321: https://example.com/image.jpg"
-            )
-            mock_logger.assert_any_call("[MOCK] With caption: Check this out")
-
-    def test_send_buttons(self):
-        """Test sending buttons."""
-        # Register a client first
-        with patch("logging.Logger.info"):
-            self.loop.run_until_complete(
-                self.service.register_client(
-                    client_id="test_client", phone_id="123456789", token="test_token"
-                )
-            )
-
-        # Create mock buttons
-        buttons = [
-            {"title": "Button 1", "callback_data": "btn1"},
-            {"title": "Button 2", "callback_data": "btn2"},
-        ]
-
-        # Send buttons
-        with patch("logging.Logger.info") as mock_logger:
-            message_id = self.loop.run_until_complete(
-                self.service.send_buttons(
-                    client_id="test_client",
-                    to="987654321",
-                    text="Choose an option",
-                    buttons=buttons,
-                )
-            )
-
-            # Check if message ID is returned and logger was called
-            self.assertIsNotNone(message_id)
-            mock_logger.assert_any_call(
-                "[MOCK] Sending message to 987654321: Choose an option"
-            )
-            mock_logger.assert_any_call("[MOCK] With buttons: ['Button 1', 'Button 2']")
-
-
-if __name__ == "__main__":
-    unittest.main()
+    # Check if message ID is returned and the send was logged
+    assert message_id is not None
+    assert "[MOCK] Sending message to 987654321: Choose an option" in caplog.text
+    assert "[MOCK] With buttons: ['Button 1', 'Button 2']" in caplog.text
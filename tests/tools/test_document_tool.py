@@ -4,7 +4,6 @@ Tests for DocumentTool with mock services.
 
 import uuid
 from typing import Any
-from unittest.mock import patch
 
 import pytest
 
@@ -29,16 +28,15 @@ async def test_document_tool_single_file(test_context: dict[str, Any]) -> None:
     assert message_ids[0] is not None, "Message ID should not be None"
     assert len(message_service.messages) == 1, "One message should be stored"
 
-    # Check message details
-    if message_service.messages:
-        message = next(iter(message_service.messages.values()))
-        assert message["type"] == "document", "Message type should be document"
-        assert message["role"] == "media_assistant", (
-            "Message role should be media_assistant"
-        )
-        assert message["data"]["url"] == file["url"], "Document URL should match"
-        assert message["data"]["filename"] == file["filename"], "Filename should match"
-        assert "mime_type" in message["data"], "MIME type should be included"
+    # Check message details - unpacking asserts exactly one stored message
+    (message,) = message_service.messages.values()
+    assert message["type"] == "document", "Message type should be document"
+    assert message["role"] == "media_assistant", (
+        "Message role should be media_assistant"
+    )
+    assert message["data"]["url"] == file["url"], "Document URL should match"
+    assert message["data"]["filename"] == file["filename"], "Filename should match"
+    assert "mime_type" in message["data"], "MIME type should be included"
 
 
 @pytest.mark.asyncio
@@ -100,27 +98,35 @@ async def test_document_tool_invalid_file(test_context: dict[str, Any]) -> None:
 
 
 @pytest.mark.asyncio
-async def test_document_tool_send_document_called(test_context: dict[str, Any]) -> None:
+async def test_document_tool_send_document_called(
+    test_context: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that _send_document method is called correctly."""
     # Arrange
     file = {"url": "https://example.com/doc.pdf", "filename": "document.pdf"}
     document_tool = DocumentTool([file])
 
-    # Use patch as context manager to mock the method while preserving access to self
-    with patch.object(DocumentTool, "_send_document", autospec=True) as mock_method:
-        # Setup the mock to return a UUID
-        test_id = str(uuid.uuid4())
-        mock_method.return_value = test_id
-
-        # Act
-        await document_tool.execute(test_context)
-
-        # Assert
-        mock_method.assert_called_once()
-        # Check that the arguments match what we expect
-        args = mock_method.call_args[0]
-        # args[0] is 'self', args[1] is phone_number, etc.
-        assert args[1] == test_context["phone_number"]
-        assert args[2] == file["url"]
-        assert args[3] == file["filename"]
-        assert args[4] == test_context["company_id"]
+    # Plain async stub recording its arguments; no autospec introspection
+    test_id = str(uuid.uuid4())
+    captured: list[tuple[str, str, str, str]] = []
+
+    async def fake_send_document(
+        _self: DocumentTool, phone_number: str, url: str, filename: str, company_id: str
+    ) -> str:
+        captured.append((phone_number, url, filename, company_id))
+        return test_id
+
+    monkeypatch.setattr(DocumentTool, "_send_document", fake_send_document)
+
+    # Act
+    await document_tool.execute(test_context)
+
+    # Assert - called once, with the expected arguments
+    assert captured == [
+        (
+            test_context["phone_number"],
+            file["url"],
+            file["filename"],
+            test_context["company_id"],
+        )
+    ]
@@ -4,7 +4,6 @@ Tests for ImageTool with mock services.
 
 import uuid
 from typing import Any
-from unittest.mock import AsyncMock, patch
 
 import pytest
 
@@ -29,14 +28,13 @@ async def test_image_tool_single_url(test_context: dict[str, Any]) -> None:
     assert message_ids[0] is not None, "Message ID should not be None"
     assert len(message_service.messages) == 1, "One message should be stored"
 
-    # Check message details
-    if message_service.messages:
-        message = next(iter(message_service.messages.values()))
-        assert message["type"] == "image", "Message type should be image"
-        assert message["role"] == "media_assistant", (
-            "Message role should be media_assistant"
-        )
-        assert message["data"]["url"] == image_url, "Image URL should match"
+    # Check message details - unpacking asserts exactly one stored message
+    (message,) = message_service.messages.values()
+    assert message["type"] == "image", "Message type should be image"
+    assert message["role"] == "media_assistant", (
+        "Message role should be media_assistant"
+    )
+    assert message["data"]["url"] == image_url, "Image URL should match"
 
 
 @pytest.mark.asyncio
@@ -75,51 +73,65 @@ async def test_image_tool_empty_list(test_context: dict[str, Any]) -> None:
 
 
 @pytest.mark.asyncio
-async def test_image_tool_send_image_called(test_context: dict[str, Any]) -> None:
+async def test_image_tool_send_image_called(
+    test_context: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that _send_image method is called correctly."""
     # Arrange
     image_url = "https://example.com/image.jpg"
     image_tool = ImageTool(image_url)
 
-    # Rather than directly accessing protected methods, patch execute and inspect call parameters
-    # Patch the WhatsApp service's send_image method instead
-    with patch('services.whatsapp_service.WhatsAppService.send_image') as mock_send_image:
-        # Setup the mock to return a message ID
-        mock_send_image.return_value = "mock_message_id"
-        
-        # Act
-        await image_tool.execute(test_context)
+    # Plain async stub recording its arguments; no autospec introspection
+    test_id = str(uuid.uuid4())
+    captured: list[tuple[str, str, str]] = []
+
+    async def fake_send_image(
+        _self: ImageTool, phone_number: str, url: str, company_id: str
+    ) -> str:
+        captured.append((phone_number, url, company_id))
+        return test_id
+
+    monkeypatch.setattr(ImageTool, "_send_image", fake_send_image)
 
-        # Assert
-        # Verify the service was called with the right parameters
-        mock_send_image.assert_called_once()
+    # Act
+    await image_tool.execute(test_context)
+
+    # Assert - called once, with the expected arguments
+    assert captured == [
+        (test_context["phone_number"], image_url, test_context["company_id"])
+    ]
 
 
 @pytest.mark.asyncio
-async def test_image_tool_handles_external_id(test_context: dict[str, Any]) -> None:
+async def test_image_tool_handles_external_id(
+    test_context: dict[str, Any], monkeypatch: pytest.MonkeyPatch
+) -> None:
     """Test that the tool correctly handles external IDs."""
     # Arrange
     image_url = "https://example.com/image.jpg"
     image_tool = ImageTool(image_url)
     test_id = str(uuid.uuid4())
 
-    # Mock the _send_image method to return a predetermined ID
-    with patch.object(
-        image_tool, "_send_image", new_callable=AsyncMock
-    ) as mock_send_image:
-        mock_send_image.return_value = test_id
+    # Stub _send_image with a plain coroutine returning a predetermined ID;
+    # patched on the class since slotted instances reject new attributes
+    async def fake_send_image(
+        _self: ImageTool, _phone_number: str, _url: str, _company_id: str
+    ) -> str:
+        return test_id
 
-        # Act
-        message_ids = await image_tool.execute(test_context)
+    monkeypatch.setattr(ImageTool, "_send_image", fake_send_image)
 
-        # Assert
-        assert message_ids[0] == test_id, (
-            "Should return the external ID from _send_image"
-        )
+    # Act
+    message_ids = await image_tool.execute(test_context)
 
-        # Check that ID is used in stored message
-        message_service = test_context["lifespan_context"]["message_service"]
-        for msg in message_service.messages.values():
-            assert msg["external_id"] == test_id, (
-                "External ID should be in stored message"
-            )
+    # Assert
+    assert message_ids[0] == test_id, (
+        "Should return the external ID from _send_image"
+    )
+
+    # Check that ID is used in stored message
+    message_service = test_context["lifespan_context"]["message_service"]
+    for msg in message_service.messages.values():
+        assert msg["external_id"] == test_id, (
+            "External ID should be in stored message"
+        )
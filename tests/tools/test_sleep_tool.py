@@ -21,17 +21,12 @@ async def test_sleep_tool_execution(test_context: dict[str, Any]) -> None:
     # Patch asyncio.sleep to avoid actually sleeping in tests
     with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
         # Act
-        start_time = time.time()
         result = await sleep_tool.execute(test_context)
-        end_time = time.time()
 
-        # Assert
+        # Assert - the mocked call proves correctness; wall-clock
+        # brackets are flaky on loaded CI and add nothing
         mock_sleep.assert_called_once_with(duration)
         assert result is None, "SleepTool should return None"
-        # Since we mock asyncio.sleep, execution should be very fast
-        assert end_time - start_time < 0.1, (
-            "Execution shouldn't take much time with mocked sleep"
-        )
 
 
 @pytest.mark.asyncio
@@ -40,13 +35,13 @@ async def test_sleep_tool_zero_duration(test_context: dict[str, Any]) -> None:
     # Arrange
     sleep_tool = SleepTool(0)
 
-    # Patch asyncio.sleep to verify it's called even with zero
+    # Patch asyncio.sleep to verify the zero fast path skips it entirely
     with patch("asyncio.sleep", new_callable=AsyncMock) as mock_sleep:
         # Act
         await sleep_tool.execute(test_context)
 
         # Assert
-        mock_sleep.assert_called_once_with(0)
+        mock_sleep.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -64,26 +59,26 @@ async def test_sleep_tool_negative_duration(test_context: dict[str, Any]) -> Non
         mock_sleep.assert_not_called()
 
 
+@pytest.mark.slow
 @pytest.mark.asyncio
 async def test_sleep_tool_actual_sleep() -> None:
     """Test that SleepTool actually sleeps (integration test)."""
-    # This test should be marked as slow as it actually sleeps
-    # Arrange
-    duration = 1  # 1 second, using int
+    # Arrange - 50ms is enough to prove the sleep isn't short-circuited
+    duration = 0.05
     sleep_tool = SleepTool(duration)
     test_context = {"foo": "bar"}  # minimal context for this test
 
-    # Act
-    start_time = time.time()
+    # Act - monotonic clock: immune to NTP adjustments mid-test
+    start_time = time.monotonic()
     await sleep_tool.execute(test_context)
-    end_time = time.time()
+    end_time = time.monotonic()
 
     # Assert
     elapsed = end_time - start_time
     assert elapsed >= duration, (
         f"Should sleep at least {duration} seconds (slept {elapsed})"
     )
-    # Allow some margin for execution overhead
-    assert elapsed < duration + 0.5, (
+    # Generous margin: scheduler jitter dominates at small durations
+    assert elapsed < duration + 0.2, (
         f"Sleep shouldn't take much longer than {duration} seconds (took {elapsed})"
     )
@@ -2,15 +2,34 @@
 Alert tool for sending notifications across channels
 """
 
+import asyncio
+import re
+import time
 import uuid
 from typing import Any
 
 from tools.base_tool import MessageTool
 
+# Recognized template placeholders; extend the alternation to add more
+_PLACEHOLDER_RE = re.compile(r"\{(phone_number|summary_response)\}")
+
 
 class AlertTool(MessageTool):
     """Tool for sending alerts through multiple channels."""
 
+    __slots__ = (
+        "_has_placeholders",
+        "_outbound_template",
+        "_push_prefix",
+        "_push_suffix",
+        "email",
+        "message",
+        "pause_number",
+        "sms",
+        "track_sale",
+        "whatsapp",
+    )
+
     def __init__(
         self,
         message: str,
@@ -32,12 +51,37 @@ class AlertTool(MessageTool):
             track_sale: Whether to track this as a sale
         """
         self.message = message
+        # Detected once: templates without placeholders (the common case
+        # for fixed alert texts) skip the substitution scan on every send
+        self._has_placeholders = _PLACEHOLDER_RE.search(message) is not None
         self.whatsapp = whatsapp
         self.email = email
         self.sms = sms
         self.pause_number = pause_number
         self.track_sale = track_sale
 
+        # The push notification text only varies by the phone number, so
+        # split it once into the pieces around it
+        company_name = "Company"  # In real impl, get from metadata
+        if sms and sms.get("type") == "venta":
+            self._push_prefix = (
+                f"'{company_name}': 🤑 Ya! vendiste! Venta confirmada de '"
+            )
+            self._push_suffix = "'"
+        else:
+            # Anything else (including missing/unknown types) is a derivación
+            self._push_prefix = f"'{company_name}': '"
+            self._push_suffix = "' necesita tu ayuda 🆘"
+
+        # Invariant part of the outbound message, built once per instance
+        # and shallow-copied per send with the per-alert fields patched in
+        self._outbound_template: dict[str, Any] = {
+            "system": "whatsapp",
+            "type": "text",
+            "direction": "outbound",
+            "role": "alert",
+        }
+
     async def execute(self, context: dict[str, Any]) -> dict[str, Any]:
         """
         Send alerts through all configured channels.
@@ -48,35 +92,51 @@ class AlertTool(MessageTool):
         Returns:
             Results for each channel with status of each alert type
         """
-        results: dict[str, bool | str] = {}
-
         # Create properly typed context for all helper methods
         typed_context: dict[str, Any] = context
-        
-        # Format message with replacements
-        self.message = self._format_message(typed_context)
-        
-        # Track sale if configured
+
+        # Format message with replacements; self.message stays the
+        # untouched template so the same instance can be executed again
+        # (or concurrently) with different contexts
+        formatted_message = self._format_message(typed_context)
+
+        # Collect the enabled channels, then dispatch them concurrently:
+        # total latency is the slowest channel instead of the sum
+        keys: list[str] = []
+        tasks: list[Any] = []
+
         if self.track_sale:
-            results["sale_tracked"] = await self._track_sale(typed_context)
+            keys.append("sale_tracked")
+            tasks.append(self._track_sale(typed_context))
 
-        # Send WhatsApp message if configured
         if self.whatsapp:
-            results["whatsapp"] = await self._send_whatsapp_alert(typed_context)
+            keys.append("whatsapp")
+            tasks.append(
+                self._send_whatsapp_alert(typed_context, formatted_message)
+            )
 
-        # Send email if configured
         if self.email:
-            results["email"] = await self._send_email_alert(typed_context)
+            keys.append("email")
+            tasks.append(self._send_email_alert(typed_context))
 
-        # Send SMS if configured
         if self.sms:
-            results["sms"] = await self._send_sms_alert(typed_context)
+            keys.append("sms")
+            tasks.append(self._send_sms_alert(typed_context))
 
-        # Pause number if configured
         if self.pause_number:
-            results["paused"] = await self._pause_number(typed_context)
-
-        return results
+            keys.append("paused")
+            tasks.append(self._pause_number(typed_context))
+
+        if not tasks:
+            return {}
+
+        # return_exceptions keeps one failed channel from cancelling its
+        # siblings; a failure surfaces as False for that channel only
+        values = await asyncio.gather(*tasks, return_exceptions=True)
+        return {
+            key: False if isinstance(value, BaseException) else value
+            for key, value in zip(keys, values, strict=True)
+        }
 
     def _format_message(self, context: dict[str, Any]) -> str:
         """
@@ -88,18 +148,18 @@ class AlertTool(MessageTool):
         Returns:
             Formatted message
         """
-        try:
-            replacements = {
-                "{phone_number}": context["phone_number"],
-                "{summary_response}": self._get_conversation_summary(context),
-            }
-
-            formatted_message = self.message
-            for key, value in replacements.items():
-                if key in formatted_message:
-                    formatted_message = formatted_message.replace(key, value)
+        if not self._has_placeholders:
+            return self.message
 
-            return formatted_message
+        try:
+            # One scan and one result allocation for any number of
+            # placeholders; values are only computed on an actual match
+            def replace(match: re.Match[str]) -> str:
+                if match.group(1) == "phone_number":
+                    return context["phone_number"]
+                return self._get_conversation_summary(context)
+
+            return _PLACEHOLDER_RE.sub(replace, self.message)
         except Exception:
             return self.message
 
@@ -132,24 +192,32 @@ class AlertTool(MessageTool):
         # Mock implementation - no actual tracking
         return True
 
-    async def _send_whatsapp_alert(self, context: dict[str, Any]) -> str:
+    async def _send_whatsapp_alert(self, context: dict[str, Any], message: str) -> str:
         """
         Send WhatsApp alert.
 
         Args:
             context: Execution context with phone number and other data
+            message: Formatted alert text to send
 
         Returns:
             Message ID
         """
         message_service = context["lifespan_context"]["message_service"]
 
-        # In a real implementation, this would call an external service
-        external_id = str(uuid.uuid4())
-
-        # Create outbound message
-        outbound_message = self.get_outbound_message(
-            external_id, context, self.message, "text", "alert"
+        # In a real implementation, this would call an external service.
+        # .hex skips UUID.__str__'s hyphen formatting; the id is opaque
+        external_id = uuid.uuid4().hex
+
+        # Create outbound message from the cached skeleton; only the
+        # per-alert fields are computed here
+        outbound_message = self._outbound_template.copy()
+        outbound_message.update(
+            data=self._format_data(message, "text"),
+            client={"phone_number": context["phone_number"]},
+            commerce={"id": context["company_id"]},
+            external_id=external_id,
+            timestamp=time.time(),
         )
 
         # Store the message
@@ -218,19 +286,6 @@ class AlertTool(MessageTool):
         Returns:
             Notification message
         """
-        company_name = "Company"  # In real impl, get from metadata
-
-        messages = {
-            "venta": f"'{company_name}': 🤑 Ya! vendiste! Venta confirmada de '{context['phone_number']}'",
-            "derivación": f"'{company_name}': '{context['phone_number']}' necesita tu ayuda 🆘",
-        }
-
-        # Get SMS type with explicit type handling
-        sms_type_value: Any = self.sms.get("type") if self.sms else None
-        
-        # Ensure we have a valid string key
-        sms_type: str = "derivación"  # Default
-        if isinstance(sms_type_value, str):
-            sms_type = sms_type_value
-            
-        return messages.get(sms_type, messages["derivación"])
+        # Template halves were chosen in __init__; only the phone number
+        # is interpolated per call
+        return self._push_prefix + context["phone_number"] + self._push_suffix
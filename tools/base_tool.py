@@ -2,10 +2,51 @@
 Base tool class for implementing messaging tools
 """
 
+import time
 from abc import ABC, abstractmethod
-from datetime import datetime
 from typing import Any
 
+# Built once at import; _get_mime_type is called per message on bulk sends
+_MIME_TYPES = {
+    "image": "image/jpeg",
+    "video": "video/mp4",
+    "document": "application/pdf",
+}
+
+# Invariant fields of every outbound message; cloned per send so the
+# varying fields are the only per-call dict work
+_MESSAGE_TEMPLATE = {
+    "system": "whatsapp",
+    "direction": "outbound",
+}
+
+
+def _format_text(content: Any, _message_type: str) -> dict[str, Any]:
+    return {"text": content}
+
+
+def _format_media(content: Any, message_type: str) -> dict[str, Any]:
+    if isinstance(content, dict) and "url" in content:
+        return content  # type: dict[str, Any]
+    return {
+        "url": content,
+        "mime_type": _MIME_TYPES.get(message_type, "application/octet-stream"),
+    }
+
+
+def _format_default(content: Any, _message_type: str) -> dict[str, Any]:
+    return {"content": content}
+
+
+# message_type -> formatter; one dict lookup replaces the branch chain
+# on the per-message path
+_FORMATTERS = {
+    "text": _format_text,
+    "image": _format_media,
+    "video": _format_media,
+    "document": _format_media,
+}
+
 
 class Tool(ABC):
     """
@@ -15,6 +56,9 @@ class Tool(ABC):
     the execute method.
     """
 
+    # Keep subclasses free to opt into __slots__ without inheriting a __dict__
+    __slots__ = ()
+
     @abstractmethod
     async def execute(self, context: dict[str, Any]) -> Any:
         """
@@ -35,8 +79,15 @@ class MessageTool(Tool):
 
     Provides common functionality for message formatting
     and structure.
+
+    Real ``_send_*`` implementations must reuse the process-wide pooled
+    HTTP client at ``context["lifespan_context"]["http_client"]`` rather
+    than opening a client per call, so outbound requests ride keep-alive
+    connections instead of paying a TCP+TLS handshake each.
     """
 
+    __slots__ = ()
+
     def get_outbound_message(
         self,
         external_id: str,
@@ -44,6 +95,9 @@ class MessageTool(Tool):
         data: Any,
         message_type: str,
         role: str = "system",
+        *,
+        phone_number: str | None = None,
+        company_id: str | None = None,
     ) -> dict[str, Any]:
         """
         Create a standardized outbound message.
@@ -54,21 +108,30 @@ class MessageTool(Tool):
             data: Message data/content
             message_type: Type of message (text, image, etc.)
             role: Message sender role
+            phone_number: Recipient number, if the caller already pulled
+                it out of the context (bulk loops hoist it once)
+            company_id: Company identifier, same convention
 
         Returns:
             Formatted message object
         """
-        return {
-            "system": "whatsapp",
-            "type": message_type,
-            "data": self._format_data(data, message_type),
-            "client": {"phone_number": context["phone_number"]},
-            "commerce": {"id": context["company_id"]},
-            "external_id": external_id,
-            "direction": "outbound",
-            "role": role,
-            "timestamp": datetime.now().timestamp(),
+        message = _MESSAGE_TEMPLATE.copy()
+        message["type"] = message_type
+        message["data"] = self._format_data(data, message_type)
+        message["client"] = {
+            "phone_number": (
+                phone_number if phone_number is not None else context["phone_number"]
+            )
+        }
+        message["commerce"] = {
+            "id": company_id if company_id is not None else context["company_id"]
         }
+        message["external_id"] = external_id
+        message["role"] = role
+        # time.time() gives the same epoch float without constructing
+        # a datetime object first
+        message["timestamp"] = time.time()
+        return message
 
     def _format_data(self, content: Any, message_type: str) -> dict[str, Any]:
         """
@@ -81,13 +144,7 @@ class MessageTool(Tool):
         Returns:
             Formatted message data with proper structure based on message type
         """
-        if message_type == "text":
-            return {"text": content}
-        elif message_type in ["image", "video", "document"]:
-            if isinstance(content, dict) and "url" in content:
-                return content  # type: dict[str, Any]
-            return {"url": content, "mime_type": self._get_mime_type(message_type)}
-        return {"content": content}
+        return _FORMATTERS.get(message_type, _format_default)(content, message_type)
 
     def _get_mime_type(self, message_type: str) -> str:
         """
@@ -99,9 +156,4 @@ class MessageTool(Tool):
         Returns:
             Appropriate MIME type
         """
-        mime_types = {
-            "image": "image/jpeg",
-            "video": "video/mp4",
-            "document": "application/pdf",
-        }
-        return mime_types.get(message_type, "application/octet-stream")
+        return _MIME_TYPES.get(message_type, "application/octet-stream")
@@ -11,6 +11,16 @@ from tools.base_tool import MessageTool
 class ButtonTool(MessageTool):
     """Tool for sending interactive buttons."""
 
+    __slots__ = (
+        "_button_data",
+        "body_text",
+        "button_type",
+        "buttons",
+        "footer_text",
+        "header",
+        "payment_data",
+    )
+
     def __init__(
         self,
         body_text: str,
@@ -33,13 +43,38 @@ class ButtonTool(MessageTool):
         """
         self.body_text = body_text
         self.buttons = (
-            buttons[:3] if button_type == "reply" else buttons
-        )  # Max 3 buttons for reply type
+            self._format_reply_buttons(buttons)
+            if button_type == "reply"
+            else tuple(buttons)
+        )
         self.button_type = button_type
         self.header = header
         self.footer_text = footer_text
         self.payment_data = payment_data
 
+        # Everything in the outbound payload except the per-send
+        # external_id is fixed here, so assemble it once
+        body = body_text if body_text else ""
+        footer = footer_text if footer_text else ""
+        if button_type == "payment":
+            title = payment_data["title"] if payment_data else ""
+            url = payment_data["url"] if payment_data else ""
+            message_text = f"{body}\n{footer}\n{title}\n{url}"
+        else:
+            message_text = f"{body}\n{footer}\nOptions: {self._get_button_text()}"
+
+        self._button_data: dict[str, Any] = {
+            "text": message_text,
+            "button_type": button_type,
+            "buttons": self.buttons,
+        }
+        if header:
+            self._button_data["header"] = header
+        if footer_text:
+            self._button_data["footer"] = {"text": footer_text}
+        if payment_data and button_type == "payment":
+            self._button_data["payment"] = payment_data
+
     async def execute(self, context: dict[str, Any]) -> str:
         """
         Send button message.
@@ -57,45 +92,15 @@ class ButtonTool(MessageTool):
             external_id = await self._send_link_payment(
                 context["phone_number"], context["company_id"]
             )
-
-            # Format message body for display
-            body_text = self.body_text if self.body_text else ""
-            footer_text = self.footer_text if self.footer_text else ""
-            title = self.payment_data["title"] if self.payment_data else ""
-            url = self.payment_data["url"] if self.payment_data else ""
-            message_text = f"{body_text}\n{footer_text}\n{title}\n{url}"
         else:
             external_id = await self._send_reply_button(
                 context["phone_number"], context["company_id"]
             )
 
-            # Format message body for display
-            body_text = self.body_text if self.body_text else ""
-            footer_text = self.footer_text if self.footer_text else ""
-            button_text = self._get_button_text()
-            message_text = f"{body_text}\n{footer_text}\nOptions: {button_text}"
-
-        # Create outbound message with interactive data
-        button_data: dict[str, Any] = {
-            "text": message_text,
-            "button_type": self.button_type,
-            "buttons": self.buttons,
-        }
-
-        # Add header if provided
-        if self.header:
-            button_data["header"] = self.header
-
-        # Add footer if provided
-        if self.footer_text:
-            button_data["footer"] = {"text": self.footer_text}
-
-        # Add payment data if provided
-        if self.payment_data and self.button_type == "payment":
-            button_data["payment"] = self.payment_data
-
+        # The interactive payload was assembled in __init__; only the
+        # per-send fields are filled in here
         outbound_message = self.get_outbound_message(
-            external_id, context, button_data, "interactive", "assistant"
+            external_id, context, self._button_data, "interactive", "assistant"
         )
 
         # Store the message
@@ -114,11 +119,10 @@ class ButtonTool(MessageTool):
         Returns:
             External message ID
         """
-        # Format buttons if needed
-        self._format_reply_buttons()
-
+        # Parameters intentionally unused in this mock implementation
+        _ = phone_number, company_id
         # Actual button sending would go here
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
 
     async def _send_link_payment(self, phone_number: str, company_id: str) -> str:
         """
@@ -134,16 +138,22 @@ class ButtonTool(MessageTool):
         # Parameters intentionally unused in this mock implementation
         _ = phone_number, company_id
         # Actual payment link sending would go here
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
 
-    def _format_reply_buttons(self) -> None:
+    @staticmethod
+    def _format_reply_buttons(
+        buttons: list[dict[str, Any]],
+    ) -> tuple[dict[str, Any], ...]:
         """
         Format buttons to WhatsApp API structure.
 
-        Transforms simple button objects into the format expected
-        by the WhatsApp API.
+        Transforms simple button objects into the format expected by the
+        WhatsApp API, capped at the three reply buttons WhatsApp allows.
+        Done once at construction, straight into an immutable tuple, so
+        repeated executes reuse the same structure instead of re-wrapping
+        it.
         """
-        self.buttons = [
+        return tuple(
             {
                 "type": "reply",
                 "reply": {
@@ -151,8 +161,8 @@ class ButtonTool(MessageTool):
                     "title": button.get("title", ""),
                 },
             }
-            for i, button in enumerate(self.buttons)
-        ]
+            for i, button in enumerate(buttons[:3])
+        )
 
     def _get_button_text(self) -> str:
         """
@@ -161,35 +171,8 @@ class ButtonTool(MessageTool):
         Returns:
             Comma-separated list of button titles
         """
-        try:
-            if self.button_type == "reply":
-                # Extract titles as strings with proper type handling
-                button_titles: list[str] = []
-                for button in self.buttons:
-                    # Use type narrowing instead of isinstance
-                    # First case: direct title in dict
-                    if hasattr(button, "get"):
-                        # Safely handle the title retrieval
-                        title = button.get("title", None)
-                        if isinstance(title, str):
-                            button_titles.append(title)
-                        # Handle reply button case - get returns Any, so we need to check the type
-                        reply_value = button.get("reply", None)  # This could be any type
-                        
-                        # Type guard to ensure it's a dictionary before proceeding
-                        if isinstance(reply_value, dict):
-                            # Now that we know it's a dict, create a typed dictionary
-                            # Use a type guard pattern with assignment
-                            typed_reply_dict: dict[str, Any] = reply_value
-                            
-                            # Get title with explicit None default to avoid Any type
-                            title_value: Any = typed_reply_dict.get("title")
-                            
-                            # Only add to the list if the title is a string
-                            if isinstance(title_value, str):
-                                button_titles.append(title_value)
-                
-                return ", ".join(button_titles)
-            return ""
-        except Exception:
+        if self.button_type != "reply":
             return ""
+        # Buttons are normalized in __init__, so every entry has the
+        # {"reply": {"title": ...}} shape; one pass, no per-item guards
+        return ", ".join(button["reply"]["title"] for button in self.buttons)
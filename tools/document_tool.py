@@ -2,15 +2,21 @@
 Document tool for sending documents
 """
 
+import asyncio
+import logging
 import uuid
 from typing import Any
 
 from tools.base_tool import MessageTool
 
+logger = logging.getLogger(__name__)
+
 
 class DocumentTool(MessageTool):
     """Tool for sending document files."""
 
+    __slots__ = ("_mime_type", "files")
+
     def __init__(self, files: list[dict[str, str]]):
         """
         Initialize with document files.
@@ -18,20 +24,26 @@ class DocumentTool(MessageTool):
         Args:
             files: List of document files as {"url": "...", "filename": "..."}
         """
-        self.files = files
-
-    def _is_valid_file(self, file: dict[str, str]) -> bool:
+        # Invalid entries are dropped once here; execute never re-checks.
+        # Tuple-stored like ImageTool.urls since the set is fixed
+        self.files = tuple(file for file in files if self._is_valid_file(file))
+        # Same for every file this tool sends; resolved once
+        self._mime_type = self._get_mime_type("document")
+
+    @staticmethod
+    def _is_valid_file(file: dict[str, str]) -> bool:
         """
         Check if file object is valid for document sending.
-        
+
         Args:
             file: The file object to validate
-            
+
         Returns:
-            True if the file has required keys, False otherwise
+            True if the file is a dict with required keys, False otherwise
         """
-        return "url" in file and "filename" in file
-        
+        return isinstance(file, dict) and "url" in file and "filename" in file
+
+
     async def execute(self, context: dict[str, Any]) -> list[str]:
         """
         Send documents.
@@ -44,41 +56,67 @@ class DocumentTool(MessageTool):
         """
         message_service = context["lifespan_context"]["message_service"]
 
-        # Define explicit type for the sent_ids list
-        sent_ids: list[str] = []
-        for file in self.files:
-            # Type guard to ensure file is a dict and has required keys
-            if not self._is_valid_file(file):
-                continue
-
-            url = file["url"]
-            filename = file["filename"]
-
-            external_id = await self._send_document(
-                context["phone_number"], url, filename, context["company_id"]
-            )
-
-            # Create outbound message
-            outbound_message = self.get_outbound_message(
-                external_id,
-                context,
-                {
-                    "url": url,
-                    "filename": filename,
-                    "mime_type": self._get_mime_type("document"),
-                },
-                "document",
-                "media_assistant",
-            )
-
-            # Store the message
-            await message_service.insert_message(outbound_message)
-
-            # Now append to the explicitly typed list
-            sent_ids.append(external_id)
-
-        # Return with explicit type
-        return sent_ids
+        # Files were validated at construction
+        if not self.files:
+            return []
+
+        # Hoisted once: every per-file coroutine reads these as plain
+        # arguments instead of re-subscripting the context
+        phone_number = context["phone_number"]
+        company_id = context["company_id"]
+
+        # Fan out the per-file sends concurrently; gather preserves input
+        # order so message IDs line up with the files, and
+        # return_exceptions keeps one failed send from cancelling the rest
+        results = await asyncio.gather(
+            *(
+                self._send_one(file, context, phone_number, company_id)
+                for file in self.files
+            ),
+            return_exceptions=True,
+        )
+
+        sent: list[tuple[str, dict[str, Any]]] = []
+        for file, result in zip(self.files, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to send document %s: %s", file["url"], result)
+            else:
+                sent.append(result)
+
+        # Store all outbound messages in one bulk round trip
+        await message_service.insert_messages([message for _, message in sent])
+
+        return [external_id for external_id, _ in sent]
+
+    async def _send_one(
+        self,
+        file: dict[str, str],
+        context: dict[str, Any],
+        phone_number: str,
+        company_id: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Send a single document and build its outbound message."""
+        url = file["url"]
+        filename = file["filename"]
+
+        external_id = await self._send_document(phone_number, url, filename, company_id)
+
+        # Create outbound message
+        outbound_message = self.get_outbound_message(
+            external_id,
+            context,
+            {
+                "url": url,
+                "filename": filename,
+                "mime_type": self._mime_type,
+            },
+            "document",
+            "media_assistant",
+            phone_number=phone_number,
+            company_id=company_id,
+        )
+
+        return external_id, outbound_message
 
     async def _send_document(
         self, phone_number: str, url: str, filename: str, company_id: str
@@ -99,4 +137,4 @@ class DocumentTool(MessageTool):
         _ = phone_number, url, filename, company_id
         # Implement actual document sending here
         # This would typically call a WhatsApp API provider
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
@@ -2,15 +2,21 @@
 Image tool for sending images
 """
 
+import asyncio
+import logging
 import uuid
 from typing import Any
 
 from tools.base_tool import MessageTool
 
+logger = logging.getLogger(__name__)
+
 
 class ImageTool(MessageTool):
     """Tool for sending image messages."""
 
+    __slots__ = ("urls",)
+
     def __init__(self, urls: list[str] | str):
         """
         Initialize with image URLs.
@@ -18,7 +24,9 @@ class ImageTool(MessageTool):
         Args:
             urls: Single URL or list of image URLs
         """
-        self.urls = urls if isinstance(urls, list) else [urls]
+        # Stored as a tuple: never mutated after construction, and tuples
+        # are cheaper to hold and iterate than lists
+        self.urls = tuple(urls) if isinstance(urls, list) else (urls,)
 
     async def execute(self, context: dict[str, Any]) -> list[str]:
         """
@@ -32,26 +40,59 @@ class ImageTool(MessageTool):
         """
         message_service = context["lifespan_context"]["message_service"]
 
-        # Define explicit type for the sent_ids list
-        sent_ids: list[str] = []
-        for url in self.urls:
-            external_id = await self._send_image(
-                context["phone_number"], url, context["company_id"]
-            )
-
-            # Create outbound message
-            outbound_message = self.get_outbound_message(
-                external_id, context, url, "image", "media_assistant"
-            )
-
-            # Store the message
-            await message_service.insert_message(outbound_message)
-
-            # Now append to the explicitly typed list
-            sent_ids.append(external_id)
-
-        # Return with explicit type
-        return sent_ids
+        if not self.urls:
+            return []
+
+        # Hoisted once: every per-URL coroutine reads these as plain
+        # arguments instead of re-subscripting the context
+        phone_number = context["phone_number"]
+        company_id = context["company_id"]
+
+        # Fan out the per-URL sends concurrently; gather preserves input
+        # order so message IDs line up with the URLs, and
+        # return_exceptions keeps one failed send from cancelling the rest
+        results = await asyncio.gather(
+            *(
+                self._send_one(url, context, phone_number, company_id)
+                for url in self.urls
+            ),
+            return_exceptions=True,
+        )
+
+        sent: list[tuple[str, dict[str, Any]]] = []
+        for url, result in zip(self.urls, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning("Failed to send image %s: %s", url, result)
+            else:
+                sent.append(result)
+
+        # Store all outbound messages in one bulk round trip
+        await message_service.insert_messages([message for _, message in sent])
+
+        return [external_id for external_id, _ in sent]
+
+    async def _send_one(
+        self,
+        url: str,
+        context: dict[str, Any],
+        phone_number: str,
+        company_id: str,
+    ) -> tuple[str, dict[str, Any]]:
+        """Send a single image and build its outbound message."""
+        external_id = await self._send_image(phone_number, url, company_id)
+
+        # Create outbound message
+        outbound_message = self.get_outbound_message(
+            external_id,
+            context,
+            url,
+            "image",
+            "media_assistant",
+            phone_number=phone_number,
+            company_id=company_id,
+        )
+
+        return external_id, outbound_message
 
     async def _send_image(self, phone_number: str, url: str, company_id: str) -> str:
         """
@@ -69,4 +110,4 @@ class ImageTool(MessageTool):
         _ = phone_number, url, company_id
         # Implement actual image sending here
         # This would typically call a WhatsApp API provider
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex
@@ -11,6 +11,8 @@ from tools.base_tool import Tool
 class SleepTool(Tool):
     """Tool for pausing execution for a specified duration."""
 
+    __slots__ = ("seconds",)
+
     def __init__(self, seconds: int):
         """
         Initialize with sleep duration.
@@ -18,7 +20,6 @@ class SleepTool(Tool):
         Args:
             seconds: Number of seconds to sleep
         """
-        self.original_seconds = seconds  # Store original value
         self.seconds = max(0, seconds)  # Ensure non-negative
 
     async def execute(self, context: dict[str, Any]) -> None:
@@ -30,12 +31,7 @@ class SleepTool(Tool):
         """
         # Parameter intentionally unused
         _ = context
-        # Only sleep if the original value was non-negative
-        if self.original_seconds >= 0:
+        # asyncio.sleep(0) still schedules a callback and yields to the
+        # loop; a zero or clamped-negative duration skips the await
+        if self.seconds > 0:
             await asyncio.sleep(self.seconds)
-
-    def _original_value_was_zero(self) -> bool:
-        """Check if the original value was exactly zero."""
-        # Since self.seconds is already normalized, we need additional logic
-        # This is a simplified approach as the actual fix would require storing the original value
-        return self.seconds == 0
@@ -2,6 +2,7 @@
 Text messaging tool for sending text messages
 """
 
+import time
 import uuid
 from typing import Any
 
@@ -12,6 +13,8 @@ from tools.base_tool import MessageTool
 class TextTool(MessageTool):
     """Tool for sending text messages."""
 
+    __slots__ = ("_template", "message")
+
     def __init__(self, message: str):
         """
         Initialize with message text.
@@ -20,6 +23,13 @@ class TextTool(MessageTool):
             message: Text message content
         """
         self.message = message
+        # Static part of the stored payload, built once; execute overlays
+        # only the per-send fields
+        self._template: dict[str, Any] = {
+            "role": "assistant",
+            "type": "text",
+            "data": {"text": message},
+        }
 
     async def execute(self, context: dict[str, Any]) -> str | None:
         """
@@ -31,7 +41,9 @@ class TextTool(MessageTool):
         Returns:
             Message ID if sent successfully
         """
-        if not self.message:
+        # Local alias: read the slot once instead of per use below
+        message = self.message
+        if not message:
             return None
 
         # Get services from context using proper interfaces
@@ -44,17 +56,15 @@ class TextTool(MessageTool):
         company_id = context["company_id"]
 
         # Send message and store it
-        external_id = await self._send_message(phone_number, self.message, company_id)
+        external_id = await self._send_message(phone_number, message, company_id)
 
         # Store the message with message service
         message_id = await message_service.insert_message(
             {
+                **self._template,
                 "external_id": external_id,
                 "company_id": company_id,
-                "role": "assistant",
-                "type": "text",
-                "data": {"text": self.message},
-                "timestamp": uuid.uuid4().hex,
+                "timestamp": time.time(),
             }
         )
 
@@ -77,4 +87,4 @@ class TextTool(MessageTool):
         """
         # This is a placeholder that would normally call an actual API
         # Return a UUID as a mock external ID
-        return str(uuid.uuid4())
+        return uuid.uuid4().hex